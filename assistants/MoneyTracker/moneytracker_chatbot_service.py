@@ -1,7 +1,30 @@
+from datetime import datetime, timezone
 from typing import Optional, Dict, Any
 from .moneytracker import MoneyTracker
 
 
+# Prompt templates, parsed once at import instead of per call
+_BUDGET_PROMPT = """Please analyze my budget:
+        
+Monthly Income: ${income}
+Monthly Expenses:
+{expense_breakdown}
+
+Total Expenses: ${total_expenses}
+Remaining: ${remaining}
+
+Please provide a detailed budget analysis with recommendations for improvement."""
+
+_SAVING_PLAN_PROMPT = """Help me create a saving plan:
+        
+Goal: {goal}
+Target Amount: ${target_amount}
+Timeframe: {timeframe_months} months
+Monthly Saving Needed: ${monthly_target:.2f}
+
+Please provide a detailed saving strategy and tips to achieve this goal."""
+
+
 class MoneyTrackerChatbotService:
     """
     Service class for MoneyTracker chatbot functionality.
@@ -49,16 +72,12 @@ class MoneyTrackerChatbotService:
         expense_breakdown = "\n".join([f"- {category}: ${amount}" for category, amount in expenses.items()])
         total_expenses = sum(expenses.values())
         
-        message = f"""Please analyze my budget:
-        
-Monthly Income: ${income}
-Monthly Expenses:
-{expense_breakdown}
-
-Total Expenses: ${total_expenses}
-Remaining: ${income - total_expenses}
-
-Please provide a detailed budget analysis with recommendations for improvement."""
+        message = _BUDGET_PROMPT.format(
+            income=income,
+            expense_breakdown=expense_breakdown,
+            total_expenses=total_expenses,
+            remaining=income - total_expenses
+        )
         
         return await self.chat(message)
     
@@ -76,14 +95,12 @@ Please provide a detailed budget analysis with recommendations for improvement."
         """
         monthly_target = target_amount / timeframe_months
         
-        message = f"""Help me create a saving plan:
-        
-Goal: {goal}
-Target Amount: ${target_amount}
-Timeframe: {timeframe_months} months
-Monthly Saving Needed: ${monthly_target:.2f}
-
-Please provide a detailed saving strategy and tips to achieve this goal."""
+        message = _SAVING_PLAN_PROMPT.format(
+            goal=goal,
+            target_amount=target_amount,
+            timeframe_months=timeframe_months,
+            monthly_target=monthly_target
+        )
         
         return await self.chat(message)
     
@@ -96,6 +113,5 @@ Please provide a detailed saving strategy and tips to achieve this goal."""
         self.conversation_history = []
     
     def _get_timestamp(self) -> str:
-        """Get current timestamp."""
-        from datetime import datetime
-        return datetime.now().isoformat()
\ No newline at end of file
+        """Get current UTC timestamp, second precision."""
+        return datetime.now(timezone.utc).isoformat(timespec='seconds')
\ No newline at end of file
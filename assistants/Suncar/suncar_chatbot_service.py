@@ -1,7 +1,58 @@
+from datetime import datetime, timezone
 from typing import Optional, Dict, Any
 from .suncar import Suncar
 
 
+class _Defaults(dict):
+    """format_map mapping that falls back to per-key defaults for missing keys"""
+    
+    def __init__(self, values: Dict[str, Any], defaults: Dict[str, Any]):
+        super().__init__(values)
+        self._defaults = defaults
+    
+    def __missing__(self, key):
+        return self._defaults[key]
+
+
+# Prompt templates, parsed once at import instead of per call
+_VEHICLE_DEFAULTS = {'make': 'Unknown', 'model': 'Unknown', 'year': 'Unknown', 'mileage': 'Unknown'}
+
+_DRIVING_DEFAULTS = {'commute_distance': 'Unknown', 'environment': 'Mixed', 'current_mpg': 'Unknown', 'style': 'Normal'}
+
+_MAINTENANCE_PROMPT = """Please provide a maintenance schedule for my vehicle:
+        
+Make: {make}
+Model: {model}
+Year: {year}
+Current Mileage: {mileage}
+
+Please include upcoming maintenance items and their recommended intervals."""
+
+_VEHICLE_CONTEXT = """
+Vehicle Details:
+Make: {make}
+Model: {model}
+Year: {year}
+Mileage: {mileage}
+"""
+
+_DIAGNOSE_PROMPT = """I'm experiencing the following issue with my vehicle:
+
+{symptoms}
+{context}
+
+Please help me diagnose the problem and suggest next steps."""
+
+_FUEL_TIPS_PROMPT = """Please provide fuel efficiency tips based on my driving habits:
+        
+Daily Commute Distance: {commute_distance} miles
+Driving Environment: {environment} (city/highway/mixed)
+Current MPG: {current_mpg}
+Driving Style: {style} (aggressive/normal/conservative)
+
+Please provide specific tips to improve my fuel efficiency."""
+
+
 class SuncarChatbotService:
     """
     Service class for Suncar chatbot functionality.
@@ -48,14 +99,7 @@ class SuncarChatbotService:
         """
         self.vehicle_profile.update(vehicle_info)
         
-        message = f"""Please provide a maintenance schedule for my vehicle:
-        
-Make: {vehicle_info.get('make', 'Unknown')}
-Model: {vehicle_info.get('model', 'Unknown')}
-Year: {vehicle_info.get('year', 'Unknown')}
-Current Mileage: {vehicle_info.get('mileage', 'Unknown')}
-
-Please include upcoming maintenance items and their recommended intervals."""
+        message = _MAINTENANCE_PROMPT.format_map(_Defaults(vehicle_info, _VEHICLE_DEFAULTS))
         
         return await self.chat(message)
     
@@ -72,20 +116,9 @@ Please include upcoming maintenance items and their recommended intervals."""
         """
         context = ""
         if vehicle_info:
-            context = f"""
-Vehicle Details:
-Make: {vehicle_info.get('make', 'Unknown')}
-Model: {vehicle_info.get('model', 'Unknown')}
-Year: {vehicle_info.get('year', 'Unknown')}
-Mileage: {vehicle_info.get('mileage', 'Unknown')}
-"""
+            context = _VEHICLE_CONTEXT.format_map(_Defaults(vehicle_info, _VEHICLE_DEFAULTS))
         
-        message = f"""I'm experiencing the following issue with my vehicle:
-
-{symptoms}
-{context}
-
-Please help me diagnose the problem and suggest next steps."""
+        message = _DIAGNOSE_PROMPT.format(symptoms=symptoms, context=context)
         
         return await self.chat(message)
     
@@ -99,14 +132,7 @@ Please help me diagnose the problem and suggest next steps."""
         Returns:
             Fuel efficiency recommendations
         """
-        message = f"""Please provide fuel efficiency tips based on my driving habits:
-        
-Daily Commute Distance: {driving_habits.get('commute_distance', 'Unknown')} miles
-Driving Environment: {driving_habits.get('environment', 'Mixed')} (city/highway/mixed)
-Current MPG: {driving_habits.get('current_mpg', 'Unknown')}
-Driving Style: {driving_habits.get('style', 'Normal')} (aggressive/normal/conservative)
-
-Please provide specific tips to improve my fuel efficiency."""
+        message = _FUEL_TIPS_PROMPT.format_map(_Defaults(driving_habits, _DRIVING_DEFAULTS))
         
         return await self.chat(message)
     
@@ -127,6 +153,5 @@ Please provide specific tips to improve my fuel efficiency."""
         self.conversation_history = []
     
     def _get_timestamp(self) -> str:
-        """Get current timestamp."""
-        from datetime import datetime
-        return datetime.now().isoformat()
\ No newline at end of file
+        """Get current UTC timestamp, second precision."""
+        return datetime.now(timezone.utc).isoformat(timespec='seconds')
\ No newline at end of file
@@ -1,7 +1,7 @@
 from abc import ABC
 from typing import Optional
 from providers import chat_with_llm
-from repositories import *
+from services.assistant_cache import get_cached_assistant_bundle_by_id
 from sqlalchemy.orm import Session
 
 
@@ -42,7 +42,8 @@ class BaseAssistant(ABC):
     
     def _load_from_database(self, assistant_id: int, db: Session):
         """Load assistant configuration from database."""
-        assistant = get_assistant_by_id(db, assistant_id)
+        # Cached per ID; a miss loads model, provider and active API keys in one query
+        assistant = get_cached_assistant_bundle_by_id(db, assistant_id)
         if not assistant:
             raise ValueError(f"Assistant with ID {assistant_id} not found")
         
@@ -55,19 +56,11 @@ class BaseAssistant(ABC):
         self.streaming = assistant.is_streaming
         
         # Get provider and model information
-        model = assistant.model
-        provider = model.provider
-        self.llm_provider = provider.name
-        self.model = model.name
+        self.llm_provider = assistant.provider_name
+        self.model = assistant.model_name
         
-        # Get API key
+        # Assistant override, else the provider's first active API key
         self.api_key = assistant.api_key
-        if not self.api_key:
-            # Get provider's default API key
-            api_keys = get_api_keys_by_provider(db, provider.id)
-            if api_keys:
-                # Use first active API key (in real app, decrypt it)
-                self.api_key = api_keys[0].encrypted_key.replace("encrypted_", "")
     
     @classmethod
     def from_database(cls, assistant_id: int, db: Session):
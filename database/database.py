@@ -10,7 +10,16 @@ DATABASE_URL = os.getenv(
     "DATABASE_URL",
 )
 
-engine = create_engine(DATABASE_URL)
+# Pool sized for concurrent admin/chat traffic; pre-ping drops dead
+# connections and recycle avoids server-side idle timeouts
+engine = create_engine(
+    DATABASE_URL,
+    pool_size=int(os.getenv("DB_POOL_SIZE", "20")),
+    max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "10")),
+    pool_timeout=30,
+    pool_pre_ping=True,
+    pool_recycle=1800,
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
@@ -1,6 +1,6 @@
 from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, JSON
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 from database.database import Base
 
 class User(Base):
@@ -45,14 +45,15 @@ class Provider(Base):
     # Dynamic Provider Fields
     is_dynamic = Column(Boolean, default=False)  # True for user-created providers
     python_code = Column(Text)  # Python code template for provider implementation
-    required_dependencies = Column(JSON)  # List of pip packages needed
-    config_schema = Column(JSON)  # Schema for configuration variables (API keys, endpoints, etc.)
+    required_dependencies = Column(JSON, nullable=False, default=list, server_default=text("'[]'"))  # List of pip packages needed
+    config_schema = Column(JSON, nullable=False, default=dict, server_default=text("'{}'"))  # Schema for configuration variables (API keys, endpoints, etc.)
     validation_code = Column(Text)  # Code to validate configuration and API keys
     
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
     models = relationship("Model", back_populates="provider")
+    api_keys = relationship("ApiKey", back_populates="provider")
 
 class Model(Base):
     __tablename__ = "models"
@@ -106,7 +107,7 @@ class ApiKey(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
-    provider = relationship("Provider")
+    provider = relationship("Provider", back_populates="api_keys")
     creator = relationship("User")
 
 
@@ -5,24 +5,87 @@ from fastapi.responses import JSONResponse
 from routers import auth, chat, admin, assistants
 from dotenv import load_dotenv
 from providers.llm_factory import LLMFactory
-from database.database import get_db
+from database.database import SessionLocal, engine
 from contextlib import asynccontextmanager
+from anyio import to_thread
+from services.assistant_cache import warm_assistant_cache, refresh_assistant_cache_forever, peek_assistant_bundle
+import asyncio
+import os
 
 load_dotenv()
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    """Load dynamic providers from database on startup"""
+# Sync endpoints (all DB-backed admin routes) run in AnyIO's worker threads,
+# which default to 40; raise the cap so DB waits overlap across more requests
+THREADPOOL_SIZE = int(os.getenv("THREADPOOL_SIZE", "100"))
+
+# Pooled DB connections opened at startup (default: the whole pool)
+DB_POOL_WARM = int(os.getenv("DB_POOL_WARM", str(engine.pool.size())))
+# Also send a one-word prompt through each preloaded assistant's provider at startup
+LLM_WARMUP_PING = os.getenv("LLM_WARMUP_PING", "false").lower() == "true"
+
+def _load_dynamic_providers():
     try:
         # Load dynamic providers from database
-        db = next(get_db())
-        LLMFactory.load_dynamic_providers_from_db(db)
+        with SessionLocal() as db:
+            LLMFactory.load_dynamic_providers_from_db(db)
         print("✅ Dynamic providers loaded successfully from database")
     except Exception as e:
         print(f"⚠️ Warning: Could not load dynamic providers: {e}")
+
+def _preload_assistants():
+    try:
+        # Preload the assistants behind the dedicated routers in one query
+        with SessionLocal() as db:
+            loaded = warm_assistant_cache(db, assistants.ASSISTANT_NAMES)
+        print(f"✅ Preloaded {loaded} assistants into the cache")
+    except Exception as e:
+        print(f"⚠️ Warning: Could not preload assistants: {e}")
+
+def _warm_db_pool():
+    try:
+        # Hold them all at once so the pool really grows instead of reusing one
+        connections = []
+        try:
+            for _ in range(DB_POOL_WARM):
+                connections.append(engine.connect())
+        finally:
+            for connection in connections:
+                connection.close()
+        print(f"✅ Opened {len(connections)} database connections")
+    except Exception as e:
+        print(f"⚠️ Warning: Could not warm the database pool: {e}")
+
+async def _warm_llm_clients():
+    """Build (and optionally ping) the provider clients the preloaded assistants will use"""
+    for name in assistants.ASSISTANT_NAMES:
+        assistant = peek_assistant_bundle(name)
+        if assistant is None:
+            continue
+        try:
+            # Same (provider, api_key) the chat path asks for, so the cached instance is reused
+            provider = await asyncio.to_thread(LLMFactory.create_provider, assistant.provider_name, assistant.api_key)
+            if LLM_WARMUP_PING:
+                await provider.chat(assistant.model_name, "ping")
+        except Exception as e:
+            print(f"⚠️ Warning: Could not warm {assistant.provider_name} for {name}: {e}")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Load dynamic providers from database on startup"""
+    to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+    
+    # Independent warmups, each with its own session: run them side by side
+    await asyncio.gather(
+        asyncio.to_thread(_load_dynamic_providers),
+        asyncio.to_thread(_preload_assistants),
+        asyncio.to_thread(_warm_db_pool)
+    )
+    await _warm_llm_clients()
+    refresh_task = asyncio.create_task(refresh_assistant_cache_forever(assistants.ASSISTANT_NAMES))
     
     yield
     
+    refresh_task.cancel()
     # Cleanup on shutdown (if needed)
     print("🔄 Application shutting down")
 
@@ -33,6 +96,19 @@ app = FastAPI(
     lifespan=lifespan
 )
 
+# Registered before CORS so it runs inside it: an @app.exception_handler(Exception)
+# would answer from ServerErrorMiddleware, outside CORS, without the CORS headers
+@app.middleware("http")
+async def unhandled_exception_middleware(request: Request, call_next):
+    """Turn unexpected errors into the same 500 body the routers used to build by hand"""
+    try:
+        return await call_next(request)
+    except Exception as exc:
+        return JSONResponse(
+            status_code=500,
+            content={"detail": str(exc)}
+        )
+
 # Add CORS middleware to allow all origins
 app.add_middleware(
     CORSMiddleware,
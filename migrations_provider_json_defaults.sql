@@ -0,0 +1,16 @@
+-- Migración para que config_schema y required_dependencies nunca sean NULL
+-- Ejecutar en PostgreSQL
+
+BEGIN;
+
+-- Rellenar los valores NULL existentes
+UPDATE providers SET config_schema = '{}' WHERE config_schema IS NULL;
+UPDATE providers SET required_dependencies = '[]' WHERE required_dependencies IS NULL;
+
+-- Valores por defecto en la base de datos y restricción NOT NULL
+ALTER TABLE providers ALTER COLUMN config_schema SET DEFAULT '{}';
+ALTER TABLE providers ALTER COLUMN config_schema SET NOT NULL;
+ALTER TABLE providers ALTER COLUMN required_dependencies SET DEFAULT '[]';
+ALTER TABLE providers ALTER COLUMN required_dependencies SET NOT NULL;
+
+COMMIT;
@@ -5,8 +5,12 @@ class LoginRequest(BaseModel):
     username: str
     password: str
 
+class RefreshRequest(BaseModel):
+    refresh_token: str
+
 class LoginResponse(BaseModel):
     token: str
+    refresh_token: Optional[str] = None
     message: str
     user_id: Optional[int] = None
     username: Optional[str] = None
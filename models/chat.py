@@ -1,5 +1,6 @@
 from pydantic import BaseModel
 from typing import Optional, Dict, Any
+from datetime import datetime
 
 class ChatRequest(BaseModel):
     message: str
@@ -19,9 +20,22 @@ class ChatResponse(BaseModel):
     provider: str
     model: str
 
+class ChatTestResponse(ChatResponse):
+    message: str
+
 class AssistantChatResponse(BaseModel):
     response: str
     assistant_name: str
     provider: str
     model: str
-    streaming_used: bool
\ No newline at end of file
+    streaming_used: bool
+
+class AssistantInfoResponse(BaseModel):
+    assistant_name: str
+    description: Optional[str] = None
+    system_prompt: str
+    model: str
+    provider: str
+    streaming_enabled: bool
+    is_active: bool
+    created_at: Optional[datetime] = None
@@ -1,7 +1,7 @@
 """
 Pydantic models for Dynamic Application management
 """
-from pydantic import BaseModel, validator
+from pydantic import BaseModel, validator, field_validator
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 
@@ -70,6 +70,17 @@ class ApplicationTemplateResponse(BaseModel):
     created_at: datetime
     updated_at: Optional[datetime] = None
     
+    @field_validator('tags', 'default_assistants', mode='before')
+    @classmethod
+    def null_list_to_empty(cls, v):
+        # Legacy rows may hold NULL in these JSON columns
+        return [] if v is None else v
+    
+    @field_validator('template_config', mode='before')
+    @classmethod
+    def null_dict_to_empty(cls, v):
+        return {} if v is None else v
+    
     class Config:
         from_attributes = True
 
@@ -152,6 +163,17 @@ class AssistantTemplateResponse(BaseModel):
     created_at: datetime
     updated_at: Optional[datetime] = None
     
+    @field_validator('tags', 'prompt_variables', mode='before')
+    @classmethod
+    def null_list_to_empty(cls, v):
+        # Legacy rows may hold NULL in these JSON columns
+        return [] if v is None else v
+    
+    @field_validator('default_config', mode='before')
+    @classmethod
+    def null_dict_to_empty(cls, v):
+        return {} if v is None else v
+    
     class Config:
         from_attributes = True
 
@@ -178,4 +200,15 @@ class TemplatePreviewResponse(BaseModel):
     """Response for template preview"""
     preview_data: Dict[str, Any]
     resolved_system_prompt: Optional[str] = None
-    resolved_config: Dict[str, Any] = {}
\ No newline at end of file
+    resolved_config: Dict[str, Any] = {}
+
+class TemplateCategoriesResponse(BaseModel):
+    """Available categories for both template kinds"""
+    application_categories: List[str]
+    assistant_categories: List[str]
+
+
+class TemplateSearchResponse(BaseModel):
+    """Template search results, only the searched kinds are present"""
+    application_templates: Optional[List[ApplicationTemplateResponse]] = None
+    assistant_templates: Optional[List[AssistantTemplateResponse]] = None
@@ -1,7 +1,7 @@
 """
 Pydantic models for Dynamic Provider management
 """
-from pydantic import BaseModel, validator
+from pydantic import BaseModel, Field, validator
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 
@@ -62,6 +62,27 @@ class DynamicProviderResponse(BaseModel):
     
     class Config:
         from_attributes = True
+    
+    @classmethod
+    def from_orm_provider(cls, provider) -> "DynamicProviderResponse":
+        """Build from a Provider instance or column row, skipping validation of trusted DB values"""
+        has_validation_code = getattr(provider, "has_validation_code", None)
+        if has_validation_code is None:
+            has_validation_code = provider.validation_code
+        return cls.model_construct(
+            id=provider.id,
+            name=provider.name,
+            display_name=provider.display_name,
+            icon_url=provider.icon_url,
+            base_url=provider.base_url,
+            is_active=provider.is_active,
+            is_dynamic=provider.is_dynamic,
+            config_schema=provider.config_schema,
+            required_dependencies=provider.required_dependencies,
+            has_validation_code=bool(has_validation_code),
+            created_at=provider.created_at,
+            updated_at=provider.updated_at
+        )
 
 
 class DynamicProviderCode(BaseModel):
@@ -104,6 +125,7 @@ class ProviderTestRequest(BaseModel):
     test_model: str = "gpt-3.5-turbo"
     test_message: str = "Hello, this is a test message"
     system_prompt: Optional[str] = None
+    timeout: float = Field(30.0, gt=0, le=120)  # Seconds to wait for the test chat
 
 
 class ProviderTestResponse(BaseModel):
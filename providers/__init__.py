@@ -1,4 +1,4 @@
-from .llm_factory import LLMFactory, chat_with_llm
+from .llm_factory import LLMFactory, chat_with_llm, chat_with_llm_stream, resolve_llm_provider
 from .llm_provider import LLMProvider
 from .google import GeminiProvider
 from .cohere import CohereProvider
@@ -6,6 +6,8 @@ from .cohere import CohereProvider
 __all__ = [
     "LLMFactory",
     "chat_with_llm", 
+    "chat_with_llm_stream",
+    "resolve_llm_provider",
     "LLMProvider",
     "GeminiProvider",
     "CohereProvider"
@@ -1,5 +1,5 @@
 import os
-from typing import Optional
+from typing import Optional, AsyncGenerator
 from ..llm_provider import LLMProvider
 
 class CohereProvider(LLMProvider):
@@ -26,9 +26,9 @@ class CohereProvider(LLMProvider):
             return await self._chat_sync(model, prompt, system_prompt)
     
     async def _chat_streaming(self, model: str, prompt: str, system_prompt: Optional[str] = None) -> str:
-        import cohere
-        full_response = ""
-        
+        return "".join([text async for text in self.chat_stream(model, prompt, system_prompt)])
+    
+    async def chat_stream(self, model: str, prompt: str, system_prompt: Optional[str] = None) -> AsyncGenerator[str, None]:
         messages = []
         if system_prompt:
             messages.append({"role": "system", "content": system_prompt})
@@ -41,14 +41,7 @@ class CohereProvider(LLMProvider):
         
         async for event in response:
             if event.type == "content-delta":
-                # For API responses, we don't want to print to console
-                # print(event.delta.message.content.text, end="", flush=True)
-                full_response += event.delta.message.content.text
-            elif event.type == "message-end":
-                # print()
-                pass
-        
-        return full_response
+                yield event.delta.message.content.text
     
     async def _chat_sync(self, model: str, prompt: str, system_prompt: Optional[str] = None) -> str:
         import cohere
@@ -4,10 +4,37 @@ Dynamic Provider System for executing user-defined LLM provider code.
 import ast
 import types
 import asyncio
+import hashlib
+import json
+import threading
 from typing import Dict, Any, Optional, List
+from cachetools import LRUCache
 from .llm_provider import LLMProvider
 
 
+def code_digest(code: str) -> bytes:
+    """Fingerprint of provider source code, used as a cache key"""
+    return hashlib.blake2b(code.encode(), digest_size=16).digest()
+
+
+# Compiled provider code keyed by code digest, so instantiating a provider
+# execs a ready code object instead of re-parsing the source every time
+_compiled_code_cache: LRUCache = LRUCache(maxsize=256)
+_compiled_code_lock = threading.Lock()
+
+
+def compile_provider_code(code: str) -> types.CodeType:
+    """Compile provider source once per distinct code digest"""
+    key = code_digest(code)
+    with _compiled_code_lock:
+        code_obj = _compiled_code_cache.get(key)
+    if code_obj is None:
+        code_obj = compile(code, "<dynamic_provider>", "exec")
+        with _compiled_code_lock:
+            _compiled_code_cache[key] = code_obj
+    return code_obj
+
+
 class SecureCodeValidator(ast.NodeVisitor):
     """Validates Python code for security and safety"""
     
@@ -26,9 +53,28 @@ class SecureCodeValidator(ast.NodeVisitor):
         'os.system', 'subprocess', 'socket', 'urllib.request.urlopen'
     }
     
+    # Validation results keyed by code digest; the UI re-validates the same
+    # source repeatedly, so skip the AST walk when it has been seen before
+    _results_cache: LRUCache = LRUCache(maxsize=512)
+    _results_lock = threading.Lock()
+    
     @classmethod
     def validate_code(cls, code: str) -> tuple[bool, str]:
-        """Validate Python code for security compliance"""
+        """Validate Python code for security compliance (cached by code digest)"""
+        key = code_digest(code)
+        with cls._results_lock:
+            cached = cls._results_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        result = cls._validate_code(code)
+        with cls._results_lock:
+            cls._results_cache[key] = result
+        return result
+    
+    @classmethod
+    def _validate_code(cls, code: str) -> tuple[bool, str]:
+        """Parse and walk the code, rejecting forbidden patterns"""
         try:
             # Parse the code into an AST
             tree = ast.parse(code)
@@ -125,13 +171,11 @@ class DynamicProvider(LLMProvider):
         
         try:
             # Import here to avoid circular imports
-            from repositories import get_api_keys_by_provider
+            from services.keys import get_provider_api_key
             
-            # Get API keys for this provider
-            api_keys = get_api_keys_by_provider(self.db_session, self.provider_id)
-            if api_keys:
-                # Use the first active API key
-                api_key = api_keys[0].encrypted_key  # It's actually the literal key
+            # First active API key, decrypted and cached per provider
+            api_key = get_provider_api_key(self.db_session, self.provider_id)
+            if api_key:
                 print(f"DEBUG: Got API key from database for provider_id {self.provider_id}")
                 # Add to config_vars so it's available in the executed code
                 self.config_vars['api_key'] = api_key
@@ -228,8 +272,8 @@ class DynamicProvider(LLMProvider):
         # Also add config vars to local namespace
         local_namespace.update(self.config_vars)
         
-        # Execute the code
-        exec(self.python_code, safe_globals, local_namespace)
+        # Execute the code (compiled once per distinct source)
+        exec(compile_provider_code(self.python_code), safe_globals, local_namespace)
         
         # Extract the required functions from the executed code
         self._extract_provider_functions(local_namespace)
@@ -449,6 +493,9 @@ class DynamicProviderManager:
     
     def __init__(self):
         self.registered_providers: Dict[str, type] = {}
+        # Providers built by the admin test endpoint, keyed by code digest and config
+        self._test_providers: LRUCache = LRUCache(maxsize=64)
+        self._test_providers_lock = threading.Lock()
     
     def create_provider_from_db(self, provider_data: Dict[str, Any], config_vars: Dict[str, Any], db_session=None, provider_id: Optional[int] = None) -> DynamicProvider:
         """Create a dynamic provider from database configuration"""
@@ -461,10 +508,30 @@ class DynamicProviderManager:
             provider_id=provider_id
         )
     
+    def get_test_provider(self, python_code: str, config_vars: Dict[str, Any]) -> DynamicProvider:
+        """Return a provider for the test endpoint, reusing one built from the same code and config"""
+        key = (code_digest(python_code), json.dumps(config_vars, sort_keys=True, default=str))
+        with self._test_providers_lock:
+            provider = self._test_providers.get(key)
+        if provider is None:
+            provider = self.create_provider_from_db(
+                {"name": "test_provider", "python_code": python_code},
+                dict(config_vars)
+            )
+            with self._test_providers_lock:
+                self._test_providers[key] = provider
+        return provider
+    
     def validate_provider_code(self, code: str) -> tuple[bool, str]:
         """Validate provider code before saving"""
         return SecureCodeValidator.validate_code(code)
     
+    def precompile_provider_code(self, code: str) -> None:
+        """Warm the compiled code cache for source that passes validation"""
+        is_valid, _ = SecureCodeValidator.validate_code(code)
+        if is_valid:
+            compile_provider_code(code)
+    
     def get_code_template(self, provider_type: str = "openai") -> str:
         """Get a code template for creating new providers"""
         templates = {
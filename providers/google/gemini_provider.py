@@ -1,5 +1,5 @@
 import os
-from typing import Optional
+from typing import Optional, AsyncGenerator
 from google import genai
 from ..llm_provider import LLMProvider
 
@@ -35,18 +35,7 @@ class GeminiProvider(LLMProvider):
                 model=model,
                 contents=contents,
             ):
-                # Handle chunk text properly
-                chunk_text = ""
-                if hasattr(chunk, 'text') and chunk.text:
-                    chunk_text = chunk.text
-                elif hasattr(chunk, 'candidates') and chunk.candidates:
-                    candidate = chunk.candidates[0]
-                    if hasattr(candidate, 'content') and candidate.content:
-                        if hasattr(candidate.content, 'parts') and candidate.content.parts:
-                            for part in candidate.content.parts:
-                                if hasattr(part, 'text') and part.text:
-                                    chunk_text += part.text
-                
+                chunk_text = self._chunk_text(chunk)
                 if chunk_text:
                     # For API responses, we don't want to print to console
                     # print(chunk_text, end="", flush=True)
@@ -56,6 +45,36 @@ class GeminiProvider(LLMProvider):
         full_response = await asyncio.to_thread(sync_streaming)
         return full_response
     
+    async def chat_stream(self, model: str, prompt: str, system_prompt: Optional[str] = None) -> AsyncGenerator[str, None]:
+        contents = []
+        if system_prompt:
+            contents.append(system_prompt)
+        contents.append(prompt)
+        
+        # Native async client: chunks are yielded as Gemini produces them
+        async for chunk in await self.client.aio.models.generate_content_stream(
+            model=model,
+            contents=contents,
+        ):
+            chunk_text = self._chunk_text(chunk)
+            if chunk_text:
+                yield chunk_text
+    
+    @staticmethod
+    def _chunk_text(chunk) -> str:
+        # Handle chunk text properly
+        if hasattr(chunk, 'text') and chunk.text:
+            return chunk.text
+        chunk_text = ""
+        if hasattr(chunk, 'candidates') and chunk.candidates:
+            candidate = chunk.candidates[0]
+            if hasattr(candidate, 'content') and candidate.content:
+                if hasattr(candidate.content, 'parts') and candidate.content.parts:
+                    for part in candidate.content.parts:
+                        if hasattr(part, 'text') and part.text:
+                            chunk_text += part.text
+        return chunk_text
+    
     async def _chat_sync(self, model: str, prompt: str, system_prompt: Optional[str] = None) -> str:
         import asyncio
         
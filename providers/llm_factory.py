@@ -1,4 +1,7 @@
-from typing import Optional, Dict, Type, Any
+from functools import lru_cache
+from cachetools import LRUCache
+import threading
+from typing import Optional, Dict, Type, Any, AsyncGenerator
 from .llm_provider import LLMProvider
 from .google import GeminiProvider
 from .cohere import CohereProvider
@@ -13,15 +16,25 @@ class LLMFactory:
     # Store dynamic provider configurations
     _dynamic_providers: Dict[str, Dict[str, Any]] = {}
     
+    # Static provider instances per (provider, api_key); each holds an SDK client
+    # whose HTTP connection pool is then reused instead of handshaking per call
+    _instances: LRUCache = LRUCache(maxsize=64)
+    _instances_lock = threading.Lock()
+    
     @classmethod
     def register_provider(cls, name: str, provider_class: Type[LLMProvider]):
         """Register a new LLM provider"""
         cls._providers[name] = provider_class
+        with cls._instances_lock:
+            for key in [k for k in cls._instances if k[0] == name]:
+                del cls._instances[key]
     
     @classmethod
     def register_dynamic_provider(cls, name: str, provider_config: Dict[str, Any]):
         """Register a dynamic provider configuration"""
         cls._dynamic_providers[name] = provider_config
+        if provider_config.get('python_code'):
+            dynamic_provider_manager.precompile_provider_code(provider_config['python_code'])
     
     @classmethod
     def create_provider(cls, provider_name: str, api_key: Optional[str] = None, config_vars: Optional[Dict[str, Any]] = None, db_session=None) -> LLMProvider:
@@ -62,8 +75,14 @@ class LLMFactory:
             available = f"Static: {available_static}; Dynamic: {available_dynamic}"
             raise ValueError(f"Provider '{provider_name}' not found. Available providers: {available}")
         
-        provider_class = cls._providers[provider_name]
-        return provider_class(api_key=api_key)
+        key = (provider_name, api_key)
+        with cls._instances_lock:
+            instance = cls._instances.get(key)
+        if instance is None:
+            instance = cls._providers[provider_name](api_key=api_key)
+            with cls._instances_lock:
+                cls._instances[key] = instance
+        return instance
     
     @classmethod
     def get_available_providers(cls) -> list[str]:
@@ -95,21 +114,18 @@ class LLMFactory:
         return dynamic_provider_manager.validate_provider_code(code)
     
     @classmethod
+    @lru_cache(maxsize=32)  # Template sources are fixed; bounded since provider_type comes from the client
     def get_code_template(cls, provider_type: str = "openai") -> str:
         """Get code template for creating new providers"""
         return dynamic_provider_manager.get_code_template(provider_type)
 
-async def chat_with_llm(
-    provider_name: str, 
-    model: str, 
-    prompt: str, 
-    system_prompt: Optional[str] = None,
-    streaming: bool = False, 
+def resolve_llm_provider(
+    provider_name: str,
     api_key: Optional[str] = None,
     config_vars: Optional[Dict[str, Any]] = None,
     db_session = None
-) -> str:
-    """Convenient function to chat with any LLM provider (static or dynamic)"""
+) -> LLMProvider:
+    """Build the provider chat_with_llm and chat_with_llm_stream talk to (DB access happens only here)"""
     
     # If config_vars contains 'python_code', this is a dynamic provider
     if config_vars and 'python_code' in config_vars:
@@ -136,18 +152,44 @@ async def chat_with_llm(
             "validation_code": config_vars.get('validation_code')
         }
         
-        provider = dynamic_provider_manager.create_provider_from_db(
+        return dynamic_provider_manager.create_provider_from_db(
             provider_data,
             merged_config,
             db_session=db_session,
             provider_id=provider_id
         )
-        return await provider.chat(model, prompt, system_prompt, streaming)
     
     # Otherwise use the factory as normal (pass db_session for registered dynamic providers)
-    provider = LLMFactory.create_provider(provider_name, api_key, config_vars, db_session)
+    return LLMFactory.create_provider(provider_name, api_key, config_vars, db_session)
+
+async def chat_with_llm(
+    provider_name: str, 
+    model: str, 
+    prompt: str, 
+    system_prompt: Optional[str] = None,
+    streaming: bool = False, 
+    api_key: Optional[str] = None,
+    config_vars: Optional[Dict[str, Any]] = None,
+    db_session = None
+) -> str:
+    """Convenient function to chat with any LLM provider (static or dynamic)"""
+    provider = resolve_llm_provider(provider_name, api_key, config_vars, db_session)
     return await provider.chat(model, prompt, system_prompt, streaming)
 
+async def chat_with_llm_stream(
+    provider_name: str, 
+    model: str, 
+    prompt: str, 
+    system_prompt: Optional[str] = None,
+    api_key: Optional[str] = None,
+    config_vars: Optional[Dict[str, Any]] = None,
+    db_session = None
+) -> AsyncGenerator[str, None]:
+    """Like chat_with_llm(streaming=True), but yields text chunks as the provider produces them"""
+    provider = resolve_llm_provider(provider_name, api_key, config_vars, db_session)
+    async for chunk in provider.chat_stream(model, prompt, system_prompt):
+        yield chunk
+
 async def main():
     # Ejemplo usando la factory
     print("Proveedores disponibles:", LLMFactory.get_available_providers())
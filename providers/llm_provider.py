@@ -29,4 +29,8 @@ class LLMProvider(ABC):
     @abstractmethod
     async def _chat_sync(self, model: str, prompt: str, system_prompt: Optional[str] = None) -> str:
         """Generate synchronous chat response"""
-        pass
\ No newline at end of file
+        pass
+    
+    async def chat_stream(self, model: str, prompt: str, system_prompt: Optional[str] = None) -> AsyncGenerator[str, None]:
+        """Yield the response text as it is generated (default: one chunk once complete)"""
+        yield await self._chat_streaming(model, prompt, system_prompt)
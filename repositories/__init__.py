@@ -34,12 +34,16 @@ __all__ = [
     # Assistant operations
     "get_assistants_by_application",
     "get_assistant_by_id",
+    "get_assistant_by_id_with_keys",
     "get_assistant_by_name",
+    "get_assistant_by_name_with_keys",
+    "get_assistants_by_names_with_keys",
     "create_assistant",
     "update_assistant",
     
     # API Key operations
     "get_api_keys_by_provider",
+    "decrypt_api_key",
     "create_api_key",
     
     # Template operations
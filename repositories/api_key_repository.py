@@ -2,6 +2,13 @@ from sqlalchemy.orm import Session
 from database.models import ApiKey
 from typing import List
 
+# Placeholder encryption used by the admin API: keys are stored with this prefix
+ENCRYPTED_KEY_PREFIX = "encrypted_"
+
+def decrypt_api_key(encrypted_key: str) -> str:
+    """Recover the plain API key from its stored form (in real app, decrypt it)"""
+    return encrypted_key.removeprefix(ENCRYPTED_KEY_PREFIX)
+
 def get_api_keys_by_provider(db: Session, provider_id: int):
     """Get all active API keys for a specific provider"""
     return db.query(ApiKey).filter(ApiKey.provider_id == provider_id, ApiKey.is_active == True).all()
@@ -1,5 +1,5 @@
-from sqlalchemy.orm import Session
-from database.models import Assistant
+from sqlalchemy.orm import Session, joinedload
+from database.models import Assistant, Model, Provider, ApiKey
 from typing import List
 
 def get_assistants_by_application(db: Session, application_id: int):
@@ -10,9 +10,35 @@ def get_assistant_by_id(db: Session, assistant_id: int):
     """Get assistant by ID"""
     return db.query(Assistant).filter(Assistant.id == assistant_id, Assistant.is_active == True).first()
 
+def get_assistant_by_id_with_keys(db: Session, assistant_id: int):
+    """Get assistant by ID with model, provider and the provider's active API keys in one query"""
+    return db.query(Assistant).options(
+        joinedload(Assistant.model)
+        .joinedload(Model.provider)
+        .joinedload(Provider.api_keys.and_(ApiKey.is_active == True))
+    ).filter(Assistant.id == assistant_id, Assistant.is_active == True).first()
+
 def get_assistant_by_name(db: Session, name: str):
-    """Get assistant by name"""
-    return db.query(Assistant).filter(Assistant.name == name, Assistant.is_active == True).first()
+    """Get assistant by name, with its model and provider loaded in the same query"""
+    return db.query(Assistant).options(
+        joinedload(Assistant.model).joinedload(Model.provider)
+    ).filter(Assistant.name == name, Assistant.is_active == True).first()
+
+def get_assistant_by_name_with_keys(db: Session, name: str):
+    """Get assistant by name with model, provider and the provider's active API keys in one query"""
+    return db.query(Assistant).options(
+        joinedload(Assistant.model)
+        .joinedload(Model.provider)
+        .joinedload(Provider.api_keys.and_(ApiKey.is_active == True))
+    ).filter(Assistant.name == name, Assistant.is_active == True).first()
+
+def get_assistants_by_names_with_keys(db: Session, names: List[str]):
+    """Same eager loading as get_assistant_by_name_with_keys, for several names in one query"""
+    return db.query(Assistant).options(
+        joinedload(Assistant.model)
+        .joinedload(Model.provider)
+        .joinedload(Provider.api_keys.and_(ApiKey.is_active == True))
+    ).filter(Assistant.name.in_(names), Assistant.is_active == True).order_by(Assistant.id).all()
 
 def create_assistant(db: Session, name: str, system_prompt: str, application_id: int, model_id: int,
                     description: str = None, api_key: str = None, is_streaming: bool = True, 
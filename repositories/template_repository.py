@@ -1,7 +1,8 @@
 """
 Repository functions for application and assistant templates
 """
-from sqlalchemy.orm import Session
+from sqlalchemy import insert, Row
+from sqlalchemy.orm import Session, joinedload
 from database.models import ApplicationTemplate, AssistantTemplate, Application, Assistant
 from models.dynamic_application import (
     ApplicationTemplateCreate, AssistantTemplateCreate,
@@ -54,15 +55,14 @@ def create_application_template(db: Session, template: ApplicationTemplateCreate
 
 def create_application_from_template(
     db: Session, 
+    template: ApplicationTemplate,
     request: ApplicationFromTemplate, 
     user_id: int
-) -> tuple[Application, List[Assistant]]:
-    """Create application and assistants from template"""
-    # Get template
-    template = get_application_template_by_id(db, request.template_id)
-    if not template:
-        raise ValueError("Template not found")
+) -> tuple[Application, List[Row]]:
+    """Create application and assistants from an already loaded template.
     
+    Assistants are returned as (id, name, endpoint, description) rows.
+    """
     # Generate endpoint if not provided
     endpoint = request.custom_endpoint
     if not endpoint:
@@ -77,11 +77,10 @@ def create_application_from_template(
         created_by=user_id
     )
     db.add(application)
-    db.commit()
-    db.refresh(application)
+    db.flush()
     
     # Create assistants if requested
-    assistants_created = []
+    assistant_rows = []
     if request.create_default_assistants and template.default_assistants:
         for assistant_config in template.default_assistants:
             # Apply customizations if provided
@@ -91,24 +90,28 @@ def create_application_from_template(
                 {}
             )
             
-            assistant = Assistant(
-                name=customization.get('name', assistant_config.get('name')),
-                description=customization.get('description', assistant_config.get('description')),
-                system_prompt=customization.get('system_prompt', assistant_config.get('system_prompt')),
-                application_id=application.id,
-                model_id=customization.get('model_id', assistant_config.get('model_id')),
-                endpoint=customization.get('endpoint', assistant_config.get('endpoint')),
-                is_streaming=customization.get('is_streaming', assistant_config.get('is_streaming', True)),
-                config=customization.get('config', assistant_config.get('config', {})),
-                created_by=user_id
-            )
-            db.add(assistant)
-            assistants_created.append(assistant)
+            assistant_rows.append({
+                'name': customization.get('name', assistant_config.get('name')),
+                'description': customization.get('description', assistant_config.get('description')),
+                'system_prompt': customization.get('system_prompt', assistant_config.get('system_prompt')),
+                'application_id': application.id,
+                'model_id': customization.get('model_id', assistant_config.get('model_id')),
+                'endpoint': customization.get('endpoint', assistant_config.get('endpoint')),
+                'is_streaming': customization.get('is_streaming', assistant_config.get('is_streaming', True)),
+                'config': customization.get('config', assistant_config.get('config', {})),
+                'created_by': user_id
+            })
     
-    if assistants_created:
-        db.commit()
-        for assistant in assistants_created:
-            db.refresh(assistant)
+    # One multi-row INSERT returning just the columns callers report back
+    assistants_created = []
+    if assistant_rows:
+        assistants_created = db.execute(
+            insert(Assistant).returning(
+                Assistant.id, Assistant.name, Assistant.endpoint, Assistant.description,
+                sort_by_parameter_order=True
+            ),
+            assistant_rows
+        ).all()
     
     # Update template usage count
     template.usage_count += 1
@@ -161,15 +164,11 @@ def create_assistant_template(db: Session, template: AssistantTemplateCreate, us
 
 def create_assistant_from_template(
     db: Session, 
+    template: AssistantTemplate,
     request: AssistantFromTemplate, 
     user_id: int
 ) -> Assistant:
-    """Create assistant from template"""
-    # Get template
-    template = get_assistant_template_by_id(db, request.template_id)
-    if not template:
-        raise ValueError("Template not found")
-    
+    """Create assistant from an already loaded template"""
     # Resolve system prompt variables
     system_prompt = template.system_prompt_template
     if request.prompt_variables:
@@ -186,8 +185,7 @@ def create_assistant_from_template(
         endpoint = f"/assistants/{request.assistant_name.lower().replace(' ', '-').replace('_', '-')}"
     
     # Merge configurations
-    config = template.default_config.copy()
-    config.update(request.custom_config)
+    config = {**(template.default_config or {}), **(request.custom_config or {})}
     
     # Create assistant
     assistant = Assistant(
@@ -201,14 +199,15 @@ def create_assistant_from_template(
         created_by=user_id
     )
     db.add(assistant)
-    db.commit()
-    db.refresh(assistant)
+    db.flush()
+    assistant_id = assistant.id
     
     # Update template usage count
     template.usage_count += 1
     db.commit()
     
-    return assistant
+    # Reload with the application joined in, callers read assistant.application
+    return db.query(Assistant).options(joinedload(Assistant.application)).filter(Assistant.id == assistant_id).one()
 
 
 def extract_template_variables(template_text: str) -> List[str]:
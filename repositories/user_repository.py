@@ -1,10 +1,8 @@
 from sqlalchemy.orm import Session
 from database.models import User
-from passlib.context import CryptContext
+from services.security import pwd_context
 from typing import Optional
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 def get_user_by_username(db: Session, username: str):
     """Get user by username"""
     return db.query(User).filter(User.username == username).first()
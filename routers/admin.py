@@ -1,6 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Request
-from sqlalchemy.orm import Session
-from database.database import get_db
+import logging
+from fastapi import APIRouter, Depends, HTTPException, Request
+from pydantic import TypeAdapter
+from sqlalchemy import and_, or_, update, exists
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, selectinload, raiseload
+from database.database import get_db, SessionLocal
 from database.models import Application, Provider, Model, Assistant, User, ApiKey
 from models.admin import (
     ApplicationCreate, ApplicationResponse,
@@ -16,43 +20,87 @@ from models.dynamic_provider import (
 from models.dynamic_application import (
     ApplicationTemplateCreate, ApplicationTemplateResponse, ApplicationFromTemplate, ApplicationCreatedResponse,
     AssistantTemplateCreate, AssistantTemplateResponse, AssistantFromTemplate, AssistantCreatedResponse,
-    TemplatePreviewRequest, TemplatePreviewResponse
+    TemplatePreviewRequest, TemplatePreviewResponse,
+    TemplateCategoriesResponse, TemplateSearchResponse
 )
-from services.auth_service import AuthService
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from repositories import (
+    get_application_templates, get_application_templates_by_category,
+    get_application_template_by_id,
+    create_application_template as _create_app_template,
+    create_application_from_template as _create_app_from_template,
+    get_assistant_templates, get_assistant_templates_by_category,
+    get_assistant_template_by_id,
+    create_assistant_template as _create_asst_template,
+    create_assistant_from_template as _create_asst_from_template,
+    preview_template_with_variables,
+    get_template_categories as _get_template_categories,
+    search_application_templates, search_assistant_templates
+)
+from services.http_cache import response_cache
+from services.assistant_cache import invalidate_assistant, clear_assistant_cache
+from services.keys import invalidate_provider_keys
+from fastapi.concurrency import run_in_threadpool
+from routers.dependencies import get_current_user, get_admin_user
 from typing import List, Optional
-from passlib.context import CryptContext
+from services.security import pwd_context
 from providers.llm_factory import LLMFactory
 from providers.dynamic_provider import dynamic_provider_manager
 import time
 import asyncio
+import copy
+
+logger = logging.getLogger(__name__)
 
+# Responses keep FastAPI's default class: with a response_model set, FastAPI
+# serializes straight to JSON bytes through pydantic-core, which is what
+# ORJSONResponse would buy us (and a custom class disables that path).
 router = APIRouter(prefix="/admin", tags=["admin"])
-security = HTTPBearer()
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
-def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
-    token = credentials.credentials
-    user_data = AuthService.verify_token(token)
-    if not user_data:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid authentication credentials"
-        )
-    return user_data
+# Relationships serialized by the response models are loaded up front; any
+# other lazy load raises instead of silently issuing one query per row
+APPLICATION_LOAD_OPTIONS = (raiseload("*"),)
+MODEL_LOAD_OPTIONS = (selectinload(Model.provider), raiseload("*"))
+ASSISTANT_LOAD_OPTIONS = (
+    selectinload(Assistant.application),
+    selectinload(Assistant.model).selectinload(Model.provider),
+    raiseload("*"),
+)
 
-def get_admin_user(current_user = Depends(get_current_user)):
-    if not current_user.get("is_admin", False):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Admin access required"
-        )
-    return current_user
+# Serializers for responses kept in the HTTP cache (bypass response_model on hits)
+_model_list_adapter = TypeAdapter(List[ModelResponse])
+_provider_list_adapter = TypeAdapter(List[ProviderResponse])
+_app_template_list_adapter = TypeAdapter(List[ApplicationTemplateResponse])
+_app_template_adapter = TypeAdapter(ApplicationTemplateResponse)
+
+def _dump(adapter: TypeAdapter, value) -> bytes:
+    return adapter.dump_json(adapter.validate_python(value, from_attributes=True))
+
+# Metadata for the code templates served by get_code_template (copied per response,
+# since the nested dicts and lists are shared module state)
+_TEMPLATES_INFO = {
+    "openai": {
+        "description": "Template for OpenAI GPT models integration",
+        "dependencies": ["openai"],
+        "config": {
+            "api_key": {"type": "string", "required": True, "description": "OpenAI API key"},
+            "max_tokens": {"type": "integer", "default": 1000, "description": "Maximum tokens per response"},
+            "temperature": {"type": "float", "default": 0.7, "description": "Sampling temperature"}
+        }
+    },
+    "anthropic": {
+        "description": "Template for Anthropic Claude models integration",
+        "dependencies": ["anthropic"],
+        "config": {
+            "api_key": {"type": "string", "required": True, "description": "Anthropic API key"},
+            "max_tokens": {"type": "integer", "default": 1000, "description": "Maximum tokens per response"}
+        }
+    }
+}
 
 # Applications CRUD
 @router.get("/applications", response_model=List[ApplicationResponse])
 def list_applications(db: Session = Depends(get_db), current_user = Depends(get_current_user)):
-    return db.query(Application).filter(Application.is_active == True).all()
+    return db.query(Application).options(*APPLICATION_LOAD_OPTIONS).filter(Application.is_active == True).all()
 
 @router.post("/applications", response_model=ApplicationResponse)
 def create_application(app: ApplicationCreate, db: Session = Depends(get_db), current_user = Depends(get_admin_user)):
@@ -71,19 +119,20 @@ def create_application(app: ApplicationCreate, db: Session = Depends(get_db), cu
 # Application Templates CRUD (must come before generic application routes to avoid path conflicts)
 @router.get("/applications/templates", response_model=List[ApplicationTemplateResponse])
 def list_application_templates(
+    request: Request,
     category: Optional[str] = None,
     db: Session = Depends(get_db), 
     current_user = Depends(get_current_user)
 ):
     """List all application templates, optionally filtered by category"""
-    from repositories import get_application_templates, get_application_templates_by_category
-    
-    if category:
-        templates = get_application_templates_by_category(db, category)
-    else:
-        templates = get_application_templates(db)
+    def build():
+        if category:
+            templates = get_application_templates_by_category(db, category)
+        else:
+            templates = get_application_templates(db)
+        return _dump(_app_template_list_adapter, templates)
     
-    return templates
+    return response_cache.respond(request, "application_templates", ("list", category), build)
 
 @router.post("/applications/templates", response_model=ApplicationTemplateResponse)
 def create_application_template(
@@ -92,10 +141,9 @@ def create_application_template(
     current_user = Depends(get_admin_user)
 ):
     """Create a new application template (admin only)"""
-    from repositories import create_application_template
-    
     try:
-        db_template = create_application_template(db, template, current_user["id"])
+        db_template = _create_app_template(db, template, current_user["id"])
+        response_cache.clear("application_templates")
         return db_template
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -103,17 +151,18 @@ def create_application_template(
 @router.get("/applications/templates/{template_id}", response_model=ApplicationTemplateResponse)
 def get_application_template(
     template_id: int,
+    request: Request,
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
     """Get specific application template"""
-    from repositories import get_application_template_by_id
-    
-    template = get_application_template_by_id(db, template_id)
-    if not template:
-        raise HTTPException(status_code=404, detail="Application template not found")
+    def build():
+        template = get_application_template_by_id(db, template_id)
+        if not template:
+            raise HTTPException(status_code=404, detail="Application template not found")
+        return _dump(_app_template_adapter, template)
     
-    return template
+    return response_cache.respond(request, "application_templates", ("item", template_id), build)
 
 @router.post("/applications/from-template", response_model=ApplicationCreatedResponse)
 def create_application_from_template(
@@ -122,14 +171,13 @@ def create_application_from_template(
     current_user = Depends(get_current_user)
 ):
     """Create application and assistants from template"""
-    from repositories import create_application_from_template, get_application_template_by_id
-    
     try:
         template = get_application_template_by_id(db, request.template_id)
         if not template:
             raise HTTPException(status_code=404, detail="Template not found")
         
-        application, assistants = create_application_from_template(db, request, current_user["id"])
+        application, assistants = _create_app_from_template(db, template, request, current_user["id"])
+        response_cache.clear("application_templates")
         
         assistants_data = [
             {
@@ -164,37 +212,36 @@ def get_application(app_id: int, db: Session = Depends(get_db), current_user = D
 
 # Providers CRUD
 @router.get("/providers", response_model=List[ProviderResponse])
-def list_providers(db: Session = Depends(get_db), current_user = Depends(get_current_user)):
-    return db.query(Provider).filter(Provider.is_active == True).all()
+def list_providers(request: Request, db: Session = Depends(get_db), current_user = Depends(get_current_user)):
+    return response_cache.respond(request, "providers", "list", lambda: _dump(
+        _provider_list_adapter, db.query(Provider).filter(Provider.is_active == True).all()
+    ))
 
 # Dynamic Providers (must come before generic provider routes)
 @router.get("/providers/dynamic", response_model=List[DynamicProviderResponse])
 def list_dynamic_providers(db: Session = Depends(get_db), current_user = Depends(get_current_user)):
     """List all dynamic providers"""
-    providers = db.query(Provider).filter(
-        Provider.is_dynamic == True, 
+    # Select only the response columns so the python_code/validation_code
+    # TEXT bodies never leave the database
+    rows = db.query(
+        Provider.id,
+        Provider.name,
+        Provider.display_name,
+        Provider.icon_url,
+        Provider.base_url,
+        Provider.is_active,
+        Provider.is_dynamic,
+        Provider.config_schema,
+        Provider.required_dependencies,
+        and_(Provider.validation_code.isnot(None), Provider.validation_code != "").label("has_validation_code"),
+        Provider.created_at,
+        Provider.updated_at
+    ).filter(
+        Provider.is_dynamic == True,
         Provider.is_active == True
     ).all()
-    
-    responses = []
-    for provider in providers:
-        response = DynamicProviderResponse(
-            id=provider.id,
-            name=provider.name,
-            display_name=provider.display_name,
-            icon_url=provider.icon_url,
-            base_url=provider.base_url,
-            is_active=provider.is_active,
-            is_dynamic=provider.is_dynamic,
-            config_schema=provider.config_schema or {},
-            required_dependencies=provider.required_dependencies or [],
-            has_validation_code=bool(provider.validation_code),
-            created_at=provider.created_at,
-            updated_at=provider.updated_at
-        )
-        responses.append(response)
-    
-    return responses
+
+    return [DynamicProviderResponse.from_orm_provider(row) for row in rows]
 
 @router.get("/providers/{provider_id}", response_model=ProviderResponse)
 def get_provider(provider_id: int, db: Session = Depends(get_db), current_user = Depends(get_current_user)):
@@ -205,12 +252,14 @@ def get_provider(provider_id: int, db: Session = Depends(get_db), current_user =
 
 # Models CRUD
 @router.get("/models", response_model=List[ModelResponse])
-def list_models(db: Session = Depends(get_db), current_user = Depends(get_current_user)):
-    return db.query(Model).filter(Model.is_active == True).all()
+def list_models(request: Request, db: Session = Depends(get_db), current_user = Depends(get_current_user)):
+    return response_cache.respond(request, "models", "list", lambda: _dump(
+        _model_list_adapter, db.query(Model).options(*MODEL_LOAD_OPTIONS).filter(Model.is_active == True).all()
+    ))
 
 @router.get("/providers/{provider_id}/models", response_model=List[ModelResponse])
 def list_provider_models(provider_id: int, db: Session = Depends(get_db), current_user = Depends(get_current_user)):
-    return db.query(Model).filter(Model.provider_id == provider_id, Model.is_active == True).all()
+    return db.query(Model).options(*MODEL_LOAD_OPTIONS).filter(Model.provider_id == provider_id, Model.is_active == True).all()
 
 @router.get("/models/{model_id}", response_model=ModelResponse)
 def get_model(model_id: int, db: Session = Depends(get_db), current_user = Depends(get_current_user)):
@@ -232,6 +281,7 @@ def create_model(model: ModelCreate, db: Session = Depends(get_db), current_user
     )
     db.add(db_model)
     db.commit()
+    response_cache.clear("models")
     db.refresh(db_model)
     return db_model
 
@@ -243,8 +293,6 @@ def list_assistant_templates(
     current_user = Depends(get_current_user)
 ):
     """List all assistant templates, optionally filtered by category"""
-    from repositories import get_assistant_templates, get_assistant_templates_by_category
-    
     if category:
         templates = get_assistant_templates_by_category(db, category)
     else:
@@ -259,10 +307,8 @@ def create_assistant_template(
     current_user = Depends(get_admin_user)
 ):
     """Create a new assistant template (admin only)"""
-    from repositories import create_assistant_template
-    
     try:
-        db_template = create_assistant_template(db, template, current_user["id"])
+        db_template = _create_asst_template(db, template, current_user["id"])
         return db_template
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -274,8 +320,6 @@ def get_assistant_template(
     current_user = Depends(get_current_user)
 ):
     """Get specific assistant template"""
-    from repositories import get_assistant_template_by_id
-    
     template = get_assistant_template_by_id(db, template_id)
     if not template:
         raise HTTPException(status_code=404, detail="Assistant template not found")
@@ -289,14 +333,12 @@ def create_assistant_from_template(
     current_user = Depends(get_current_user)
 ):
     """Create assistant from template"""
-    from repositories import create_assistant_from_template, get_assistant_template_by_id
-    
     try:
         template = get_assistant_template_by_id(db, request.template_id)
         if not template:
             raise HTTPException(status_code=404, detail="Template not found")
         
-        assistant = create_assistant_from_template(db, request, current_user["id"])
+        assistant = _create_asst_from_template(db, template, request, current_user["id"])
         
         # Get resolved system prompt preview (first 200 chars)
         system_prompt_preview = assistant.system_prompt[:200] + "..." if len(assistant.system_prompt) > 200 else assistant.system_prompt
@@ -319,11 +361,11 @@ def create_assistant_from_template(
 # Assistants CRUD
 @router.get("/assistants", response_model=List[AssistantResponse])
 def list_assistants(db: Session = Depends(get_db), current_user = Depends(get_current_user)):
-    return db.query(Assistant).filter(Assistant.is_active == True).all()
+    return db.query(Assistant).options(*ASSISTANT_LOAD_OPTIONS).filter(Assistant.is_active == True).all()
 
 @router.get("/applications/{app_id}/assistants", response_model=List[AssistantResponse])
 def list_application_assistants(app_id: int, db: Session = Depends(get_db), current_user = Depends(get_current_user)):
-    return db.query(Assistant).filter(Assistant.application_id == app_id, Assistant.is_active == True).all()
+    return db.query(Assistant).options(*ASSISTANT_LOAD_OPTIONS).filter(Assistant.application_id == app_id, Assistant.is_active == True).all()
 
 @router.get("/assistants/{assistant_id}", response_model=AssistantResponse)
 def get_assistant(assistant_id: int, db: Session = Depends(get_db), current_user = Depends(get_current_user)):
@@ -353,25 +395,45 @@ def create_assistant(assistant: AssistantCreate, db: Session = Depends(get_db),
 
 @router.put("/assistants/{assistant_id}", response_model=AssistantResponse)
 def update_assistant(assistant_id: int, assistant_update: AssistantUpdate, db: Session = Depends(get_db), current_user = Depends(get_current_user)):
-    db_assistant = db.query(Assistant).filter(Assistant.id == assistant_id, Assistant.is_active == True).first()
+    update_data = assistant_update.dict(exclude_none=True)
+    if not update_data:
+        return get_assistant(assistant_id, db, current_user)
+    
+    # Single UPDATE ... RETURNING instead of SELECT, UPDATE and refresh
+    db_assistant = db.execute(
+        update(Assistant)
+        .where(Assistant.id == assistant_id, Assistant.is_active == True)
+        .values(**update_data)
+        .returning(Assistant)
+        .options(*ASSISTANT_LOAD_OPTIONS)
+        .execution_options(populate_existing=True)
+    ).scalar_one_or_none()
     if not db_assistant:
         raise HTTPException(status_code=404, detail="Assistant not found")
     
-    update_data = assistant_update.dict(exclude_none=True)
-    for key, value in update_data.items():
-        setattr(db_assistant, key, value)
-    
+    # Build the response before commit expires the loaded attributes
+    response = AssistantResponse.model_validate(db_assistant, from_attributes=True)
     db.commit()
-    db.refresh(db_assistant)
-    return db_assistant
+    # The assistant may have been renamed, so drop every cached bundle
+    clear_assistant_cache()
+    return response
+
+@router.post("/assistants/{name}/invalidate")
+def invalidate_assistant_cache(name: str, current_user = Depends(get_admin_user)):
+    """Drop an assistant's cached configuration so the next chat reloads it"""
+    invalidate_assistant(name)
+    return {"message": f"Cache for assistant '{name}' invalidated"}
 
 # Users CRUD
 @router.post("/users", response_model=UserResponse)
 def create_user(user: UserCreate, db: Session = Depends(get_db), current_user = Depends(get_admin_user)):
-    # Check if user already exists
-    if db.query(User).filter(User.username == user.username).first():
-        raise HTTPException(status_code=400, detail="Username already exists")
-    if db.query(User).filter(User.email == user.email).first():
+    # Check username and email uniqueness in a single lookup
+    existing = db.query(User.username, User.email).filter(
+        or_(User.username == user.username, User.email == user.email)
+    ).first()
+    if existing:
+        if existing.username == user.username:
+            raise HTTPException(status_code=400, detail="Username already exists")
         raise HTTPException(status_code=400, detail="Email already exists")
     
     hashed_password = pwd_context.hash(user.password)
@@ -383,7 +445,12 @@ def create_user(user: UserCreate, db: Session = Depends(get_db), current_user =
         is_admin=user.is_admin
     )
     db.add(db_user)
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError:
+        # A concurrent request created the same username/email after our check
+        db.rollback()
+        raise HTTPException(status_code=400, detail="Username or email already exists")
     db.refresh(db_user)
     return db_user
 
@@ -403,26 +470,13 @@ def create_api_key(api_key: ApiKeyCreate, db: Session = Depends(get_db), current
     )
     db.add(db_api_key)
     db.commit()
+    clear_assistant_cache()
+    invalidate_provider_keys(api_key.provider_id)
     db.refresh(db_api_key)
     return db_api_key
 
 # Dynamic Providers CRUD
 
-@router.post("/providers/dynamic/debug")
-async def debug_dynamic_provider(request: Request):
-    """Debug endpoint to see raw request data"""
-    body = await request.body()
-    print(f"Raw request body: {body.decode('utf-8')}")
-    try:
-        import json
-        json_data = json.loads(body.decode('utf-8'))
-        print(f"Parsed JSON keys: {list(json_data.keys())}")
-        for key, value in json_data.items():
-            print(f"  {key}: {type(value)} = {str(value)[:100]}...")
-    except Exception as e:
-        print(f"Error parsing JSON: {e}")
-    return {"message": "Debug info logged"}
-
 @router.post("/providers/dynamic", response_model=DynamicProviderResponse)
 def create_dynamic_provider(
     provider: DynamicProviderCreate, 
@@ -430,58 +484,43 @@ def create_dynamic_provider(
     current_user = Depends(get_admin_user)
 ):
     """Create a new dynamic provider with custom Python code"""
-    
-    # Debug logging
-    print(f"Received provider data:")
-    print(f"  name: {getattr(provider, 'name', 'MISSING')}")
-    print(f"  display_name: {getattr(provider, 'display_name', 'MISSING')}")
-    print(f"  python_code: {getattr(provider, 'python_code', 'MISSING')[:100] if hasattr(provider, 'python_code') else 'MISSING'}...")
-    print(f"  config_schema: {getattr(provider, 'config_schema', 'MISSING')}")
-    print(f"  required_dependencies: {getattr(provider, 'required_dependencies', 'MISSING')}")
-    
-    print(f"Creating dynamic provider: {provider.name}")
-    print(f"Display name: {provider.display_name}")
-    print(f"Config schema: {provider.config_schema}")
+    logger.debug("Creating dynamic provider %s", provider.name)
     
     # Validate the Python code first
-    try:
-        is_valid, error_message = LLMFactory.validate_dynamic_provider_code(provider.python_code)
-        if not is_valid:
-            print(f"Code validation failed: {error_message}")
-            raise HTTPException(
-                status_code=400, 
-                detail=f"Code validation failed: {error_message}"
-            )
-    except Exception as e:
-        print(f"Validation error: {e}")
-        raise HTTPException(status_code=500, detail=f"Validation error: {str(e)}")
+    is_valid, error_message = LLMFactory.validate_dynamic_provider_code(provider.python_code)
+    if not is_valid:
+        logger.debug("Code validation failed for %s: %s", provider.name, error_message)
+        raise HTTPException(
+            status_code=400, 
+            detail=f"Code validation failed: {error_message}"
+        )
     
     # Check if provider name already exists
-    existing_provider = db.query(Provider).filter(Provider.name == provider.name).first()
-    if existing_provider:
-        print(f"Provider name already exists: {provider.name}")
+    name_taken = db.query(exists().where(Provider.name == provider.name)).scalar()
+    if name_taken:
         raise HTTPException(status_code=400, detail="Provider name already exists")
     
     # Create the dynamic provider
-    try:
-        db_provider = Provider(
-            name=provider.name,
-            display_name=provider.display_name,
-            icon_url=provider.icon_url,
-            base_url=provider.base_url,
-            is_dynamic=True,
-            python_code=provider.python_code,
-            config_schema=provider.config_schema,
-            required_dependencies=provider.required_dependencies,
-            validation_code=provider.validation_code
-        )
-        print(f"Created provider object: {db_provider.name}")
-    except Exception as e:
-        print(f"Error creating provider object: {e}")
-        raise HTTPException(status_code=500, detail=f"Error creating provider: {str(e)}")
+    db_provider = Provider(
+        name=provider.name,
+        display_name=provider.display_name,
+        icon_url=provider.icon_url,
+        base_url=provider.base_url,
+        is_dynamic=True,
+        python_code=provider.python_code,
+        config_schema=provider.config_schema,
+        required_dependencies=provider.required_dependencies,
+        validation_code=provider.validation_code
+    )
     
     db.add(db_provider)
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError:
+        # Lost a race with a concurrent create of the same name
+        db.rollback()
+        raise HTTPException(status_code=400, detail="Provider name already exists")
+    response_cache.clear("providers", "models")
     db.refresh(db_provider)
     
     # Register the provider in the factory
@@ -494,23 +533,7 @@ def create_dynamic_provider(
         'validation_code': provider.validation_code,
     })
     
-    # Return response with has_validation_code field
-    response = DynamicProviderResponse(
-        id=db_provider.id,
-        name=db_provider.name,
-        display_name=db_provider.display_name,
-        icon_url=db_provider.icon_url,
-        base_url=db_provider.base_url,
-        is_active=db_provider.is_active,
-        is_dynamic=db_provider.is_dynamic,
-        config_schema=db_provider.config_schema or {},
-        required_dependencies=db_provider.required_dependencies or [],
-        has_validation_code=bool(db_provider.validation_code),
-        created_at=db_provider.created_at,
-        updated_at=db_provider.updated_at
-    )
-    
-    return response
+    return DynamicProviderResponse.from_orm_provider(db_provider)
 
 
 @router.get("/providers/dynamic/{provider_id}", response_model=DynamicProviderResponse)
@@ -529,22 +552,7 @@ def get_dynamic_provider(
     if not provider:
         raise HTTPException(status_code=404, detail="Dynamic provider not found")
     
-    response = DynamicProviderResponse(
-        id=provider.id,
-        name=provider.name,
-        display_name=provider.display_name,
-        icon_url=provider.icon_url,
-        base_url=provider.base_url,
-        is_active=provider.is_active,
-        is_dynamic=provider.is_dynamic,
-        config_schema=provider.config_schema or {},
-        required_dependencies=provider.required_dependencies or [],
-        has_validation_code=bool(provider.validation_code),
-        created_at=provider.created_at,
-        updated_at=provider.updated_at
-    )
-    
-    return response
+    return DynamicProviderResponse.from_orm_provider(provider)
 
 @router.put("/providers/dynamic/{provider_id}", response_model=DynamicProviderResponse)
 def update_dynamic_provider(
@@ -578,6 +586,7 @@ def update_dynamic_provider(
         setattr(db_provider, key, value)
     
     db.commit()
+    response_cache.clear("providers", "models")
     db.refresh(db_provider)
     
     # Re-register in factory if code was updated
@@ -591,22 +600,7 @@ def update_dynamic_provider(
             'validation_code': db_provider.validation_code,
         })
     
-    response = DynamicProviderResponse(
-        id=db_provider.id,
-        name=db_provider.name,
-        display_name=db_provider.display_name,
-        icon_url=db_provider.icon_url,
-        base_url=db_provider.base_url,
-        is_active=db_provider.is_active,
-        is_dynamic=db_provider.is_dynamic,
-        config_schema=db_provider.config_schema or {},
-        required_dependencies=db_provider.required_dependencies or [],
-        has_validation_code=bool(db_provider.validation_code),
-        created_at=db_provider.created_at,
-        updated_at=db_provider.updated_at
-    )
-    
-    return response
+    return DynamicProviderResponse.from_orm_provider(db_provider)
 
 @router.get("/providers/dynamic/{provider_id}/code", response_model=DynamicProviderCode)
 def get_provider_code(
@@ -652,42 +646,25 @@ def validate_provider_code(
 
 @router.get("/providers/code/template", response_model=CodeTemplateResponse)
 def get_code_template(
+    http_request: Request,
     request: CodeTemplateRequest = Depends(),
     current_user = Depends(get_admin_user)
 ):
     """Get a code template for creating dynamic providers"""
-    template_code = LLMFactory.get_code_template(request.provider_type)
-    
-    # Define template metadata
-    templates_info = {
-        "openai": {
-            "description": "Template for OpenAI GPT models integration",
-            "dependencies": ["openai"],
-            "config": {
-                "api_key": {"type": "string", "required": True, "description": "OpenAI API key"},
-                "max_tokens": {"type": "integer", "default": 1000, "description": "Maximum tokens per response"},
-                "temperature": {"type": "float", "default": 0.7, "description": "Sampling temperature"}
-            }
-        },
-        "anthropic": {
-            "description": "Template for Anthropic Claude models integration",
-            "dependencies": ["anthropic"],
-            "config": {
-                "api_key": {"type": "string", "required": True, "description": "Anthropic API key"},
-                "max_tokens": {"type": "integer", "default": 1000, "description": "Maximum tokens per response"}
-            }
-        }
-    }
-    
-    info = templates_info.get(request.provider_type, templates_info["openai"])
+    def build():
+        template_code = LLMFactory.get_code_template(request.provider_type)
+        
+        info = copy.deepcopy(_TEMPLATES_INFO.get(request.provider_type, _TEMPLATES_INFO["openai"]))
+        
+        return CodeTemplateResponse(
+            provider_type=request.provider_type,
+            template=template_code,
+            description=info["description"],
+            required_dependencies=info["dependencies"],
+            config_schema=info["config"]
+        ).model_dump_json().encode()
     
-    return CodeTemplateResponse(
-        provider_type=request.provider_type,
-        template=template_code,
-        description=info["description"],
-        required_dependencies=info["dependencies"],
-        config_schema=info["config"]
-    )
+    return response_cache.respond(http_request, "code_templates", request.provider_type, build)
 
 @router.post("/providers/dynamic/test", response_model=ProviderTestResponse)
 async def test_dynamic_provider(
@@ -706,22 +683,29 @@ async def test_dynamic_provider(
                 error=f"Code validation failed: {error_message}"
             )
         
-        # Create a temporary dynamic provider
-        test_provider = dynamic_provider_manager.create_provider_from_db(
-            {
-                "name": "test_provider",
-                "python_code": request.python_code
-            },
+        # Reuse the provider built for the same code and config on earlier test runs
+        test_provider = dynamic_provider_manager.get_test_provider(
+            request.python_code,
             request.config_vars
         )
         
-        # Test the provider
-        response = await test_provider.chat(
-            model=request.test_model,
-            prompt=request.test_message,
-            system_prompt=request.system_prompt,
-            streaming=False
-        )
+        # Test the provider, bounded so a hanging upstream can't hold the request
+        try:
+            response = await asyncio.wait_for(
+                test_provider.chat(
+                    model=request.test_model,
+                    prompt=request.test_message,
+                    system_prompt=request.system_prompt,
+                    streaming=False
+                ),
+                timeout=request.timeout
+            )
+        except asyncio.TimeoutError:
+            return ProviderTestResponse(
+                success=False,
+                error=f"Test chat timed out after {request.timeout} seconds",
+                execution_time=time.time() - start_time
+            )
         
         execution_time = time.time() - start_time
         
@@ -744,22 +728,77 @@ def delete_dynamic_provider(
     current_user = Depends(get_admin_user)
 ):
     """Soft delete a dynamic provider"""
-    provider = db.query(Provider).filter(
-        Provider.id == provider_id,
-        Provider.is_dynamic == True
-    ).first()
+    result = db.execute(
+        update(Provider)
+        .where(Provider.id == provider_id, Provider.is_dynamic == True)
+        .values(is_active=False)
+    )
     
-    if not provider:
+    if result.rowcount == 0:
         raise HTTPException(status_code=404, detail="Dynamic provider not found")
     
-    provider.is_active = False
     db.commit()
+    response_cache.clear("providers", "models")
     
     return {"message": "Dynamic provider deleted successfully"}
 
 
 # ============ TEMPLATE UTILITIES ENDPOINTS ============
 
+def _preview_application_template(db: Session, request: TemplatePreviewRequest) -> TemplatePreviewResponse:
+    template = get_application_template_by_id(db, request.template_id)
+    if not template:
+        raise HTTPException(status_code=404, detail="Application template not found")
+    
+    # Preview application data
+    preview_data = {
+        "name": template.name,
+        "display_name": template.display_name,
+        "description": template.description,
+        "category": template.category,
+        "default_assistants": template.default_assistants
+    }
+    
+    return TemplatePreviewResponse(
+        preview_data=preview_data,
+        resolved_config=template.template_config
+    )
+
+
+def _preview_assistant_template(db: Session, request: TemplatePreviewRequest) -> TemplatePreviewResponse:
+    template = get_assistant_template_by_id(db, request.template_id)
+    if not template:
+        raise HTTPException(status_code=404, detail="Assistant template not found")
+    
+    # Resolve system prompt with variables
+    resolved_prompt = preview_template_with_variables(
+        template.system_prompt_template, 
+        request.variables
+    )
+    
+    preview_data = {
+        "name": template.name,
+        "display_name": template.display_name,
+        "description": template.description,
+        "category": template.category,
+        "default_provider": template.default_provider,
+        "default_model": template.default_model,
+        "prompt_variables": template.prompt_variables
+    }
+    
+    return TemplatePreviewResponse(
+        preview_data=preview_data,
+        resolved_system_prompt=resolved_prompt,
+        resolved_config=template.default_config
+    )
+
+
+_PREVIEW_DISPATCH = {
+    "application": _preview_application_template,
+    "assistant": _preview_assistant_template,
+}
+
+
 @router.post("/templates/preview", response_model=TemplatePreviewResponse)
 def preview_template(
     request: TemplatePreviewRequest,
@@ -767,91 +806,51 @@ def preview_template(
     current_user = Depends(get_current_user)
 ):
     """Preview template with variables resolved"""
-    from repositories import (
-        get_application_template_by_id, get_assistant_template_by_id,
-        preview_template_with_variables
-    )
-    
     try:
-        if request.template_type == "application":
-            template = get_application_template_by_id(db, request.template_id)
-            if not template:
-                raise HTTPException(status_code=404, detail="Application template not found")
-            
-            # Preview application data
-            preview_data = {
-                "name": template.name,
-                "display_name": template.display_name,
-                "description": template.description,
-                "category": template.category,
-                "default_assistants": template.default_assistants
-            }
-            
-            return TemplatePreviewResponse(
-                preview_data=preview_data,
-                resolved_config=template.template_config
-            )
-            
-        elif request.template_type == "assistant":
-            template = get_assistant_template_by_id(db, request.template_id)
-            if not template:
-                raise HTTPException(status_code=404, detail="Assistant template not found")
-            
-            # Resolve system prompt with variables
-            resolved_prompt = preview_template_with_variables(
-                template.system_prompt_template, 
-                request.variables
-            )
-            
-            preview_data = {
-                "name": template.name,
-                "display_name": template.display_name,
-                "description": template.description,
-                "category": template.category,
-                "default_provider": template.default_provider,
-                "default_model": template.default_model,
-                "prompt_variables": template.prompt_variables
-            }
-            
-            return TemplatePreviewResponse(
-                preview_data=preview_data,
-                resolved_system_prompt=resolved_prompt,
-                resolved_config=template.default_config
-            )
-        else:
+        handler = _PREVIEW_DISPATCH.get(request.template_type)
+        if handler is None:
             raise HTTPException(status_code=400, detail="Invalid template_type. Must be 'application' or 'assistant'")
+        
+        return handler(db, request)
             
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
-@router.get("/templates/categories")
+@router.get("/templates/categories", response_model=TemplateCategoriesResponse)
 def get_template_categories(
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
     """Get available template categories"""
-    from repositories import get_template_categories
-    
-    return get_template_categories(db)
+    return _get_template_categories(db)
+
+
+def _search_in_own_session(search, q: str):
+    """Run one template search on its own session so searches can run in parallel threads"""
+    db = SessionLocal()
+    try:
+        return search(db, q)
+    finally:
+        db.close()
 
 
-@router.get("/templates/search")
-def search_templates(
+@router.get("/templates/search", response_model=TemplateSearchResponse, response_model_exclude_unset=True)
+async def search_templates(
     q: str,
     template_type: Optional[str] = None,
-    db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
     """Search templates by query string"""
-    from repositories import search_application_templates, search_assistant_templates
-    
-    results = {}
+    searches = {}
     
     if not template_type or template_type == "application":
-        results["application_templates"] = search_application_templates(db, q)
+        searches["application_templates"] = search_application_templates
     
     if not template_type or template_type == "assistant":
-        results["assistant_templates"] = search_assistant_templates(db, q)
+        searches["assistant_templates"] = search_assistant_templates
     
-    return results
\ No newline at end of file
+    results = await asyncio.gather(
+        *(run_in_threadpool(_search_in_own_session, search, q) for search in searches.values())
+    )
+    return dict(zip(searches, results))
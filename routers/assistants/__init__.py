@@ -1,5 +1,10 @@
 # Routers for specific assistants
 from .suncar_router import router as suncar_router
+from .suncar_router import ASSISTANT_NAME as SUNCAR_ASSISTANT_NAME
 from .moneytracker_router import router as moneytracker_router
+from .moneytracker_router import ASSISTANT_NAME as MONEYTRACKER_ASSISTANT_NAME
 
-__all__ = ["suncar_router", "moneytracker_router"] 
\ No newline at end of file
+# Assistants served by the routers above, kept warm in the assistant cache
+ASSISTANT_NAMES = (SUNCAR_ASSISTANT_NAME, MONEYTRACKER_ASSISTANT_NAME)
+
+__all__ = ["suncar_router", "moneytracker_router", "ASSISTANT_NAMES"] 
\ No newline at end of file
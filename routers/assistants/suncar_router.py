@@ -1,107 +1,66 @@
-from fastapi import APIRouter, HTTPException, Depends, status
-from sqlalchemy.orm import Session
-from database.database import get_db
-from repositories import *
-from models.chat import AssistantChatRequest, AssistantChatResponse
-from providers import chat_with_llm
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from services.auth_service import AuthService
-from typing import Optional
-from datetime import datetime
+from fastapi import APIRouter, Depends
+from models.chat import AssistantChatRequest, AssistantChatResponse, AssistantInfoResponse
+from routers.dependencies import get_current_user
+from services.assistant_resolver import resolve_assistant_call_context, chat_with_assistant, stream_with_assistant
+from services.sse import sse_response
 
-router = APIRouter(prefix="/suncar", tags=["Suncar Assistant"])
-security = HTTPBearer()
+# Database name of the assistant this router serves (preloaded at startup)
+ASSISTANT_NAME = "Suncar"
 
-def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
-    """Verify JWT token and return user data"""
-    token = credentials.credentials
-    user_data = AuthService.verify_token(token)
-    if not user_data:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid authentication credentials"
-        )
-    return user_data
+router = APIRouter(prefix="/suncar", tags=["Suncar Assistant"])
 
 @router.post("/chat", response_model=AssistantChatResponse)
 async def chat_with_suncar(
     request: AssistantChatRequest, 
-    db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
     """
     Chat with Suncar automotive assistant.
     This endpoint loads Suncar's configuration from the database.
     """
-    try:
-        # Get Suncar assistant from database by name
-        assistant = get_assistant_by_name(db, "Suncar")
-        if not assistant:
-            raise HTTPException(status_code=404, detail="Suncar assistant not found")
-        
-        if not assistant.is_active:
-            raise HTTPException(status_code=400, detail="Suncar assistant is not active")
-        
-        # Get the model and provider information
-        model = assistant.model
-        provider = model.provider
-        
-        # Get API key (from assistant or provider's api_keys)
-        api_key = assistant.api_key
-        if not api_key:
-            # Get provider's default API key
-            api_keys = get_api_keys_by_provider(db, provider.id)
-            if api_keys:
-                # Use first active API key (in real app, decrypt it)
-                api_key = api_keys[0].encrypted_key.replace("encrypted_", "")
-        
-        # Use streaming override if provided, otherwise use assistant's default
-        use_streaming = request.streaming if request.streaming is not None else assistant.is_streaming
-        
-        # Chat with LLM using Suncar's configuration from database
-        response = await chat_with_llm(
-            provider_name=provider.name,
-            model=model.name,
-            prompt=request.prompt,
-            system_prompt=assistant.system_prompt,
-            streaming=use_streaming,
-            api_key=api_key
-        )
-        
-        return AssistantChatResponse(
-            response=response,
-            assistant_name=assistant.name,
-            provider=provider.display_name,
-            model=model.display_name,
-            streaming_used=use_streaming
+    # Suncar configuration, served from the in-process cache after the first request
+    assistant = await resolve_assistant_call_context(ASSISTANT_NAME)
+    
+    # Use streaming override if provided, otherwise use assistant's default
+    use_streaming = request.streaming if request.streaming is not None else assistant.is_streaming
+    
+    # Streaming answers go out as server-sent events while the model is still generating
+    if use_streaming:
+        return await sse_response(
+            stream_with_assistant(assistant, request.prompt),
+            done={
+                "assistant_name": assistant.name,
+                "provider": assistant.provider_display_name,
+                "model": assistant.model_display_name
+            }
         )
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    
+    # Chat with LLM using Suncar's configuration (repeated prompts are served from memory)
+    response = await chat_with_assistant(assistant, request.prompt, use_streaming)
+    
+    # Values are server-built; response_model validation is the only pass needed
+    return AssistantChatResponse.model_construct(
+        response=response,
+        assistant_name=assistant.name,
+        provider=assistant.provider_display_name,
+        model=assistant.model_display_name,
+        streaming_used=use_streaming
+    )
 
-@router.get("/info")
+@router.get("/info", response_model=AssistantInfoResponse)
 async def get_suncar_info(
-    db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
     """Get Suncar assistant information and configuration"""
-    try:
-        assistant = get_assistant_by_name(db, "Suncar")
-        if not assistant:
-            raise HTTPException(status_code=404, detail="Suncar assistant not found")
-        
-        return {
-            "assistant_name": assistant.name,
-            "description": assistant.description,
-            "system_prompt": assistant.system_prompt,
-            "model": assistant.model.display_name,
-            "provider": assistant.model.provider.display_name,
-            "streaming_enabled": assistant.is_streaming,
-            "is_active": assistant.is_active,
-            "created_at": assistant.created_at
-        }
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e)) 
\ No newline at end of file
+    assistant = await resolve_assistant_call_context(ASSISTANT_NAME)
+    
+    return AssistantInfoResponse.model_construct(
+        assistant_name=assistant.name,
+        description=assistant.description,
+        system_prompt=assistant.system_prompt,
+        model=assistant.model_display_name,
+        provider=assistant.provider_display_name,
+        streaming_enabled=assistant.is_streaming,
+        is_active=assistant.is_active,
+        created_at=assistant.created_at
+    )
\ No newline at end of file
@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-from models.auth import LoginRequest, LoginResponse
+from models.auth import LoginRequest, LoginResponse, RefreshRequest
 from services.auth_service import AuthService
 from database.database import get_db
 
@@ -8,4 +9,10 @@ router = APIRouter(prefix="/auth", tags=["authentication"])
 
 @router.post("/login", response_model=LoginResponse)
 async def login(credentials: LoginRequest, db: Session = Depends(get_db)):
-    return AuthService.authenticate_user_db(db, credentials)
\ No newline at end of file
+    # bcrypt verification is CPU bound, keep it off the event loop
+    return await run_in_threadpool(AuthService.authenticate_user_db, db, credentials)
+
+@router.post("/refresh", response_model=LoginResponse)
+def refresh(request: RefreshRequest, db: Session = Depends(get_db)):
+    """Trade a refresh token for a fresh access token (and a rotated refresh token)"""
+    return AuthService.refresh_tokens_db(db, request.refresh_token)
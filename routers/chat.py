@@ -1,50 +1,88 @@
-from fastapi import APIRouter, HTTPException, Depends
-from sqlalchemy.orm import Session
-from models.chat import ChatRequest, ChatResponse
-from providers import chat_with_llm
-from database.database import get_db
-from repositories import *
+from fastapi import APIRouter
+from fastapi.concurrency import run_in_threadpool
+from models.chat import ChatRequest, ChatResponse, ChatTestResponse
+from providers import chat_with_llm, resolve_llm_provider
+from database.database import SessionLocal
+from services.single_flight import SingleFlight
+from services.assistant_resolver import LLM_RESPONSE_CACHE_TTL
+from services.sse import sse_response
+from cachetools import TTLCache
+import hashlib
+import json
+import threading
 
 router = APIRouter(prefix="/chat", tags=["chat"])
 
-@router.post("/", response_model=ChatResponse)
-async def chat(request: ChatRequest, db: Session = Depends(get_db)):
-    try:
-        response = await chat_with_llm(
+# Identical non-streaming requests already being answered share that answer,
+# and completed answers are replayed for LLM_RESPONSE_CACHE_TTL seconds
+_inflight = SingleFlight()
+_response_cache: TTLCache = TTLCache(maxsize=2048, ttl=LLM_RESPONSE_CACHE_TTL)
+_response_lock = threading.Lock()
+
+def _chat_key(request: ChatRequest) -> bytes:
+    raw = json.dumps(
+        [request.provider, request.model, request.system_prompt, request.message, request.api_key, request.config_vars],
+        sort_keys=True, default=str
+    )
+    return hashlib.blake2b(raw.encode(), digest_size=16).digest()
+
+def _resolve_provider(request: ChatRequest):
+    # Provider lookups are the only DB work; the session is closed (and its
+    # connection back in the pool) before the slow LLM round-trip starts.
+    # Blocking (ORM queries, dynamic provider exec), so callers run it in the threadpool
+    with SessionLocal() as db:
+        return resolve_llm_provider(
             provider_name=request.provider,
-            model=request.model,
-            prompt=request.message,
-            system_prompt=request.system_prompt,
-            streaming=request.streaming,
             api_key=request.api_key,
             config_vars=request.config_vars,
             db_session=db
         )
-        
-        return ChatResponse(
-            response=response,
-            provider=request.provider,
-            model=request.model
+
+async def _chat_once(request: ChatRequest) -> str:
+    provider = await run_in_threadpool(_resolve_provider, request)
+    return await provider.chat(request.model, request.message, request.system_prompt, request.streaming)
+
+async def _chat_cached(key: bytes, request: ChatRequest) -> str:
+    response = await _chat_once(request)
+    with _response_lock:
+        _response_cache[key] = response
+    return response
+
+@router.post("/", response_model=ChatResponse)
+async def chat(request: ChatRequest):
+    # Streaming answers go out as server-sent events while the model is still generating
+    if request.streaming:
+        provider = await run_in_threadpool(_resolve_provider, request)
+        return await sse_response(
+            provider.chat_stream(request.model, request.message, request.system_prompt),
+            done={"provider": request.provider, "model": request.model}
         )
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    
+    key = _chat_key(request)
+    with _response_lock:
+        response = _response_cache.get(key)
+    if response is None:
+        response = await _inflight.do(key, lambda: _chat_cached(key, request))
+    
+    return ChatResponse(
+        response=response,
+        provider=request.provider,
+        model=request.model
+    )
 
-@router.get("/test")
+@router.get("/test", response_model=ChatTestResponse)
 async def test_gemini():
-    try:
-        response = await chat_with_llm(
-            provider_name="gemini",
-            model="gemini-2.5-pro",
-            prompt="¿Cuál es tu función principal?",
-            system_prompt="Eres un asistente especializado en desarrollo de software.",
-            streaming=False
-        )
-        
-        return {
-            "message": "Test successful",
-            "response": response,
-            "provider": "gemini",
-            "model": "gemini-2.5-pro"
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+    response = await chat_with_llm(
+        provider_name="gemini",
+        model="gemini-2.5-pro",
+        prompt="¿Cuál es tu función principal?",
+        system_prompt="Eres un asistente especializado en desarrollo de software.",
+        streaming=False
+    )
+    
+    return {
+        "message": "Test successful",
+        "response": response,
+        "provider": "gemini",
+        "model": "gemini-2.5-pro"
+    }
\ No newline at end of file
@@ -0,0 +1,165 @@
+"""
+In-process cache of the assistant configuration used by the assistant chat routers.
+
+Assistant, model, provider and API key rows change rarely, so the values the
+routers need are resolved once into an immutable bundle and kept for a short
+TTL. Admin writes invalidate it explicitly, and the assistants served by the
+dedicated routers are preloaded at startup and refreshed in the background so
+they never expire on the request path.
+"""
+import asyncio
+import os
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterable, Optional
+
+from cachetools import TTLCache
+from sqlalchemy.orm import Session
+
+from database.database import SessionLocal
+from repositories import (
+    get_assistant_by_id_with_keys,
+    get_assistant_by_name_with_keys,
+    get_assistants_by_names_with_keys,
+    decrypt_api_key,
+)
+
+
+ASSISTANT_CACHE_TTL = int(os.getenv("ASSISTANT_CACHE_TTL", "60"))
+# Kept below the TTL so preloaded assistants are replaced before they expire
+ASSISTANT_REFRESH_INTERVAL = int(os.getenv("ASSISTANT_REFRESH_INTERVAL", str(max(ASSISTANT_CACHE_TTL // 2, 1))))
+
+
+@dataclass(frozen=True)
+class AssistantBundle:
+    """Everything the assistant routers read, detached from the ORM session"""
+    id: int
+    name: str
+    description: Optional[str]
+    system_prompt: str
+    is_streaming: bool
+    is_active: bool
+    created_at: Optional[datetime]
+    model_name: str
+    model_display_name: str
+    provider_name: str
+    provider_display_name: str
+    api_key: Optional[str]
+
+
+_CACHE: TTLCache = TTLCache(maxsize=64, ttl=ASSISTANT_CACHE_TTL)
+# Same bundles looked up by primary key, for assistants loaded by ID
+_CACHE_BY_ID: TTLCache = TTLCache(maxsize=1024, ttl=ASSISTANT_CACHE_TTL)
+_lock = threading.Lock()
+
+
+def _build_bundle(db: Session, name: str) -> Optional[AssistantBundle]:
+    assistant = get_assistant_by_name_with_keys(db, name)
+    if not assistant:
+        return None
+    return _bundle_from_assistant(assistant)
+
+
+def _bundle_from_assistant(assistant) -> AssistantBundle:
+    model = assistant.model
+    provider = model.provider
+
+    # Assistant override first, then the provider's first active key
+    api_key = assistant.api_key
+    if not api_key and provider.api_keys:
+        # Use first active API key, decrypted once per cache fill
+        api_key = decrypt_api_key(provider.api_keys[0].encrypted_key)
+
+    return AssistantBundle(
+        id=assistant.id,
+        name=assistant.name,
+        description=assistant.description,
+        system_prompt=assistant.system_prompt,
+        is_streaming=assistant.is_streaming,
+        is_active=assistant.is_active,
+        created_at=assistant.created_at,
+        model_name=model.name,
+        model_display_name=model.display_name,
+        provider_name=provider.name,
+        provider_display_name=provider.display_name,
+        api_key=api_key,
+    )
+
+
+def peek_assistant_bundle(name: str) -> Optional[AssistantBundle]:
+    """Return the cached bundle for name without touching the database"""
+    with _lock:
+        return _CACHE.get(name)
+
+
+def get_cached_assistant_bundle(db: Session, name: str) -> Optional[AssistantBundle]:
+    """Return the assistant bundle for name, querying the database only on a miss"""
+    bundle = peek_assistant_bundle(name)
+    if bundle is not None:
+        return bundle
+
+    bundle = _build_bundle(db, name)
+    if bundle is not None:
+        with _lock:
+            _CACHE[name] = bundle
+    return bundle
+
+
+def get_cached_assistant_bundle_by_id(db: Session, assistant_id: int) -> Optional[AssistantBundle]:
+    """Return the assistant bundle for an ID, querying the database only on a miss"""
+    with _lock:
+        bundle = _CACHE_BY_ID.get(assistant_id)
+    if bundle is not None:
+        return bundle
+
+    assistant = get_assistant_by_id_with_keys(db, assistant_id)
+    if not assistant:
+        return None
+    bundle = _bundle_from_assistant(assistant)
+    with _lock:
+        _CACHE_BY_ID[assistant_id] = bundle
+    return bundle
+
+
+def invalidate_assistant(name: str) -> None:
+    """Drop one assistant from the cache"""
+    with _lock:
+        _CACHE.pop(name, None)
+        for assistant_id in [k for k, b in _CACHE_BY_ID.items() if b.name == name]:
+            _CACHE_BY_ID.pop(assistant_id, None)
+
+
+def clear_assistant_cache() -> None:
+    """Drop every cached assistant, e.g. after a rename or key change"""
+    with _lock:
+        _CACHE.clear()
+        _CACHE_BY_ID.clear()
+
+
+def warm_assistant_cache(db: Session, names: Iterable[str]) -> int:
+    """Load the named assistants with one query and store them; returns how many were found"""
+    bundles = {}
+    for assistant in get_assistants_by_names_with_keys(db, list(names)):
+        # Same pick as get_assistant_by_name: the first matching row wins
+        if assistant.name not in bundles:
+            bundles[assistant.name] = _bundle_from_assistant(assistant)
+    with _lock:
+        _CACHE.update(bundles)
+    return len(bundles)
+
+
+def _warm_in_own_session(names: Iterable[str]) -> int:
+    with SessionLocal() as db:
+        return warm_assistant_cache(db, names)
+
+
+async def refresh_assistant_cache_forever(names: Iterable[str], interval: int = ASSISTANT_REFRESH_INTERVAL) -> None:
+    """Reload the named assistants every interval seconds; meant to run as a background task"""
+    names = list(names)
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await asyncio.to_thread(_warm_in_own_session, names)
+        except Exception as e:
+            print(f"⚠️ Warning: Could not refresh assistant cache: {e}")
@@ -0,0 +1,102 @@
+"""
+Shared lookup for the assistant routers: resolve everything a chat call needs
+for a named assistant, or raise the HTTP error the endpoint should return.
+"""
+import hashlib
+import os
+import threading
+from typing import AsyncIterator
+
+from cachetools import TTLCache
+from fastapi import HTTPException
+from fastapi.concurrency import run_in_threadpool
+
+from database.database import SessionLocal
+from providers import chat_with_llm, chat_with_llm_stream
+from services.assistant_cache import AssistantBundle, get_cached_assistant_bundle, peek_assistant_bundle
+from services.single_flight import SingleFlight
+
+
+LLM_RESPONSE_CACHE_TTL = int(os.getenv("LLM_RESPONSE_CACHE_TTL", "600"))
+
+# Completed LLM answers keyed by a digest of provider, model, system prompt and prompt
+_response_cache: TTLCache = TTLCache(maxsize=1024, ttl=LLM_RESPONSE_CACHE_TTL)
+_response_lock = threading.Lock()
+
+# Identical prompts arriving while the first is still with the provider wait for it
+_inflight = SingleFlight()
+
+
+def _load_assistant_bundle(name: str):
+    # Own short-lived session: it only connects on a cache miss, and is closed
+    # before the caller awaits the LLM so no pooled connection is held meanwhile
+    with SessionLocal() as db:
+        return get_cached_assistant_bundle(db, name)
+
+
+async def resolve_assistant_call_context(name: str) -> AssistantBundle:
+    """Return the (cached) provider, model, prompt and API key for an assistant"""
+    assistant = peek_assistant_bundle(name)
+    if assistant is None:
+        # Cache miss: the ORM query blocks, so run it in the threadpool
+        assistant = await run_in_threadpool(_load_assistant_bundle, name)
+    if not assistant:
+        raise HTTPException(status_code=404, detail=f"{name} assistant not found")
+
+    if not assistant.is_active:
+        raise HTTPException(status_code=400, detail=f"{name} assistant is not active")
+
+    return assistant
+
+
+def _response_key(ctx: AssistantBundle, prompt: str) -> bytes:
+    raw = f"{ctx.provider_name}|{ctx.model_name}|{ctx.system_prompt}|{prompt}"
+    return hashlib.blake2b(raw.encode(), digest_size=16).digest()
+
+
+async def chat_with_assistant(ctx: AssistantBundle, prompt: str, streaming: bool) -> str:
+    """chat_with_llm for an assistant, answering repeated identical prompts from memory"""
+    key = _response_key(ctx, prompt)
+    with _response_lock:
+        cached = _response_cache.get(key)
+    if cached is not None:
+        return cached
+
+    async def call() -> str:
+        response = await chat_with_llm(
+            provider_name=ctx.provider_name,
+            model=ctx.model_name,
+            prompt=prompt,
+            system_prompt=ctx.system_prompt,
+            streaming=streaming,
+            api_key=ctx.api_key
+        )
+        with _response_lock:
+            _response_cache[key] = response
+        return response
+
+    return await _inflight.do(key, call)
+
+
+async def stream_with_assistant(ctx: AssistantBundle, prompt: str) -> AsyncIterator[str]:
+    """Stream an assistant's answer chunk by chunk; completed answers feed the same cache"""
+    key = _response_key(ctx, prompt)
+    with _response_lock:
+        cached = _response_cache.get(key)
+    if cached is not None:
+        yield cached
+        return
+
+    parts = []
+    async for chunk in chat_with_llm_stream(
+        provider_name=ctx.provider_name,
+        model=ctx.model_name,
+        prompt=prompt,
+        system_prompt=ctx.system_prompt,
+        api_key=ctx.api_key
+    ):
+        parts.append(chunk)
+        yield chunk
+
+    with _response_lock:
+        _response_cache[key] = "".join(parts)
@@ -1,53 +1,133 @@
 from models.auth import LoginRequest, LoginResponse
-from repositories import authenticate_user
+from repositories import authenticate_user, get_user_by_username
 from sqlalchemy.orm import Session
 from jose import JWTError, jwt
-from datetime import datetime, timedelta
+from cachetools import TTLCache
+import base64
+import hashlib
+import hmac
+import json
+import threading
+import time
 import os
 
 
 SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key-change-this-in-production")
 ALGORITHM = "HS256"
-ACCESS_TOKEN_EXPIRE_MINUTES = 30
+ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
+REFRESH_TOKEN_EXPIRE_DAYS = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", "7"))
+
+def _b64url(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+# The JWS header and HMAC key never change, so tokens are signed without going through jose
+_HEADER_B64 = _b64url(json.dumps({"alg": ALGORITHM, "typ": "JWT"}, separators=(",", ":")).encode())
+_SIGNING_KEY = SECRET_KEY.encode()
+
+# Verified token payloads, so repeated requests with the same token skip the JWT decode.
+# Keyed by the process-local SipHash of the signature segment (already an HMAC, so
+# no further hashing is needed) and storing the unsigned header.payload to compare
+# on a hit; neither the key nor the value is enough to replay the bearer token.
+# Entries live at most 30s (or the access token lifetime, if shorter) and are
+# also checked against exp.
+_token_cache: TTLCache = TTLCache(maxsize=10_000, ttl=min(ACCESS_TOKEN_EXPIRE_MINUTES * 60, 30))
+_token_cache_lock = threading.Lock()
+
+def _split_token(token: str) -> tuple[int, str]:
+    signing_input, _, signature = token.rpartition(".")
+    return hash(signature), signing_input
+
 
 class AuthService:
     @staticmethod
     def create_access_token(data: dict):
+        return AuthService._sign(data, "access", ACCESS_TOKEN_EXPIRE_MINUTES * 60)
+
+    @staticmethod
+    def create_refresh_token(data: dict):
+        return AuthService._sign(data, "refresh", REFRESH_TOKEN_EXPIRE_DAYS * 86400)
+
+    @staticmethod
+    def _sign(data: dict, token_type: str, lifetime_seconds: int) -> str:
         to_encode = data.copy()
-        expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-        to_encode.update({"exp": expire})
-        encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
-        return encoded_jwt
+        to_encode["typ"] = token_type
+        # Same NumericDate jose would write for a datetime exp
+        to_encode["exp"] = int(time.time()) + lifetime_seconds
+        payload_b64 = _b64url(json.dumps(to_encode, separators=(",", ":")).encode())
+        signing_input = f"{_HEADER_B64}.{payload_b64}"
+        signature = hmac.new(_SIGNING_KEY, signing_input.encode(), hashlib.sha256).digest()
+        return f"{signing_input}.{_b64url(signature)}"
 
     @staticmethod
     def authenticate_user_db(db: Session, credentials: LoginRequest) -> LoginResponse:
         user = authenticate_user(db, credentials.username, credentials.password)
         if user:
-            access_token = AuthService.create_access_token(
-                data={"sub": user.username, "user_id": user.id, "is_admin": user.is_admin}
-            )
-            return LoginResponse(
-                token=access_token,
-                message="Login successful",
-                user_id=user.id,
-                username=user.username,
-                is_admin=user.is_admin
-            )
+            return AuthService._issue_tokens(user, "Login successful")
         else:
             return LoginResponse(
                 token="",
                 message="Invalid credentials"
             )
 
+    @staticmethod
+    def refresh_tokens_db(db: Session, refresh_token: str) -> LoginResponse:
+        """Exchange a refresh token for a new access/refresh pair, re-checking the user"""
+        try:
+            payload = jwt.decode(refresh_token, SECRET_KEY, algorithms=[ALGORITHM])
+        except JWTError:
+            payload = None
+        
+        user = None
+        if payload and payload.get("typ") == "refresh" and payload.get("sub"):
+            user = get_user_by_username(db, payload["sub"])
+        # Refresh is where revocation happens: deleted or deactivated users get nothing
+        if not user or not user.is_active:
+            return LoginResponse(
+                token="",
+                message="Invalid refresh token"
+            )
+        return AuthService._issue_tokens(user, "Token refreshed")
+
+    @staticmethod
+    def _issue_tokens(user, message: str) -> LoginResponse:
+        claims = {"sub": user.username, "user_id": user.id, "is_admin": user.is_admin}
+        return LoginResponse(
+            token=AuthService.create_access_token(data=claims),
+            refresh_token=AuthService.create_refresh_token(data=claims),
+            message=message,
+            user_id=user.id,
+            username=user.username,
+            is_admin=user.is_admin
+        )
+
     @staticmethod
     def verify_token(token: str):
+        key, signing_input = _split_token(token)
+        with _token_cache_lock:
+            cached = _token_cache.get(key)
+        # A different header.payload under the same key falls through to a full decode
+        if cached is not None and cached[0] == signing_input:
+            _, user_data, expires_at = cached
+            # The cache TTL may outlive the token itself
+            if expires_at is None or expires_at > time.time():
+                return dict(user_data)
+            with _token_cache_lock:
+                _token_cache.pop(key, None)
+            return None
+
         try:
             payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+            # Refresh tokens are only good at /auth/refresh (tokens issued before typ existed are access tokens)
+            if payload.get("typ", "access") != "access":
+                return None
             username: str = payload.get("sub")
             user_id: int = payload.get("user_id")
             is_admin: bool = payload.get("is_admin", False)
             if username is None:
                 return None
-            return {"username": username, "user_id": user_id, "is_admin": is_admin}
+            user_data = {"username": username, "user_id": user_id, "is_admin": is_admin}
+            with _token_cache_lock:
+                _token_cache[key] = (signing_input, user_data, payload.get("exp"))
+            return dict(user_data)
         except JWTError:
             return None
\ No newline at end of file
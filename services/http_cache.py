@@ -0,0 +1,71 @@
+"""
+In-process HTTP response cache for read-mostly endpoints.
+
+Serialized JSON bodies are kept per namespace for a short TTL and served with
+an ETag, so repeat UI loads skip the database and clients can revalidate with
+If-None-Match. Write endpoints clear the namespaces they affect.
+"""
+import hashlib
+import os
+import threading
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+from cachetools import TTLCache
+from fastapi import Request, Response
+
+
+HTTP_CACHE_TTL = int(os.getenv("HTTP_CACHE_TTL", "60"))
+
+
+class ResponseCache:
+    """TTL cache of serialized response bodies grouped by namespace"""
+
+    def __init__(self, ttl: int = HTTP_CACHE_TTL, maxsize: int = 1024):
+        self.ttl = ttl
+        self._entries: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        # Bumped on clear so a build that raced an invalidation is not stored
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, namespace: str, key: Hashable) -> Optional[Tuple[bytes, str]]:
+        with self._lock:
+            return self._entries.get((namespace, key))
+
+    def set(self, namespace: str, key: Hashable, body: bytes, generation: Optional[int] = None) -> Tuple[bytes, str]:
+        entry = (body, '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"')
+        with self._lock:
+            if generation is None or generation == self._generations.get(namespace, 0):
+                self._entries[(namespace, key)] = entry
+        return entry
+
+    def clear(self, *namespaces: str) -> None:
+        with self._lock:
+            for namespace in namespaces:
+                self._generations[namespace] = self._generations.get(namespace, 0) + 1
+            for cache_key in [k for k in list(self._entries.keys()) if k[0] in namespaces]:
+                self._entries.pop(cache_key, None)
+
+    def respond(self, request: Request, namespace: str, key: Hashable, build: Callable[[], bytes]) -> Response:
+        """Serve a cached JSON body (or 304), building and storing it on a miss"""
+        entry = self.get(namespace, key)
+        if entry is None:
+            with self._lock:
+                generation = self._generations.get(namespace, 0)
+            entry = self.set(namespace, key, build(), generation)
+
+        body, etag = entry
+        # no-cache: the client must revalidate every time, so a write's clear() is seen at once
+        headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+        if _etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=headers)
+        return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+response_cache = ResponseCache()
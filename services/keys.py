@@ -0,0 +1,46 @@
+"""
+In-memory cache of decrypted provider API keys.
+
+Providers built per request (dynamic providers) need their provider's first
+active key. Keys change rarely, so the lookup and decrypt happen once per
+provider per TTL; the plain keys are held in process memory only.
+"""
+import os
+import threading
+from typing import Optional
+
+from cachetools import TTLCache
+from sqlalchemy.orm import Session
+
+from repositories import get_api_keys_by_provider, decrypt_api_key
+
+
+PROVIDER_KEY_CACHE_TTL = int(os.getenv("PROVIDER_KEY_CACHE_TTL", "300"))
+
+# provider_id -> decrypted key, or None when the provider has no active key
+_CACHE: TTLCache = TTLCache(maxsize=256, ttl=PROVIDER_KEY_CACHE_TTL)
+_lock = threading.Lock()
+_MISSING = object()
+
+
+def get_provider_api_key(db: Session, provider_id: int) -> Optional[str]:
+    """Return the provider's first active API key, decrypted, querying only on a miss"""
+    with _lock:
+        api_key = _CACHE.get(provider_id, _MISSING)
+    if api_key is not _MISSING:
+        return api_key
+
+    api_keys = get_api_keys_by_provider(db, provider_id)
+    api_key = decrypt_api_key(api_keys[0].encrypted_key) if api_keys else None
+    with _lock:
+        _CACHE[provider_id] = api_key
+    return api_key
+
+
+def invalidate_provider_keys(provider_id: Optional[int] = None) -> None:
+    """Forget the cached key of one provider, or of all providers"""
+    with _lock:
+        if provider_id is None:
+            _CACHE.clear()
+        else:
+            _CACHE.pop(provider_id, None)
@@ -0,0 +1,11 @@
+import os
+from passlib.context import CryptContext
+
+# bcrypt work factor for new hashes; existing hashes keep verifying with their own rounds
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+
+# Single shared hashing context for the whole application
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=BCRYPT_ROUNDS)
+
+# Hash once at import so the bcrypt backend is loaded before the first request
+pwd_context.hash("warmup")
@@ -0,0 +1,46 @@
+"""
+Server-sent events for streamed LLM answers.
+
+Text chunks are forwarded to the client as they arrive instead of being joined
+into one JSON body, so the first token reaches the client as soon as the
+provider produces it.
+"""
+import json
+from typing import AsyncIterator, Optional
+
+from fastapi.responses import StreamingResponse
+
+
+def _event(data: str, event: Optional[str] = None) -> bytes:
+    lines = [f"event: {event}"] if event else []
+    # A newline inside the payload would end the field; SSE wants one data: per line
+    lines.extend(f"data: {line}" for line in data.split("\n"))
+    return ("\n".join(lines) + "\n\n").encode()
+
+
+async def _events(first: str, chunks: AsyncIterator[str], done: dict) -> AsyncIterator[bytes]:
+    yield _event(first)
+    try:
+        async for chunk in chunks:
+            yield _event(chunk)
+    except Exception as e:
+        # Headers are already sent, so report the failure in-band
+        yield _event(str(e), "error")
+        return
+    yield _event(json.dumps(done), "done")
+
+
+async def sse_response(chunks: AsyncIterator[str], done: Optional[dict] = None) -> StreamingResponse:
+    """
+    Stream chunks as text/event-stream.
+
+    The first chunk is awaited before the response starts, so provider errors
+    raised while connecting (bad key, unknown model) still become a normal
+    HTTP error. A final "done" event carries the done payload.
+    """
+    first = await anext(chunks, "")
+    return StreamingResponse(
+        _events(first, chunks, done or {}),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
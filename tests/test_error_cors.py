@@ -0,0 +1,35 @@
+"""
+Unexpected 500s must still carry the CORS headers browser clients need to read them.
+
+Run with: python -m unittest discover -s tests
+"""
+import os
+import tempfile
+import unittest
+
+_DB_FILE = os.path.join(tempfile.mkdtemp(), "test_error_cors.db")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{_DB_FILE}")
+
+from fastapi.testclient import TestClient
+
+from main import app
+
+
+class UnhandledErrorCorsTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.client = TestClient(app, raise_server_exceptions=False)
+
+    def test_500_has_detail_and_cors_header(self):
+        response = self.client.post(
+            "/chat/",
+            json={"message": "hi", "provider": "no_such_provider"},
+            headers={"Origin": "http://client.example"},
+        )
+        self.assertEqual(response.status_code, 500)
+        self.assertIn("no_such_provider", response.json()["detail"])
+        self.assertEqual(response.headers.get("access-control-allow-origin"), "http://client.example")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+"""
+Template search must serialize templates whose JSON columns are NULL.
+
+Run with: python -m unittest discover -s tests
+"""
+import os
+import tempfile
+import unittest
+
+_DB_FILE = os.path.join(tempfile.mkdtemp(), "test_template_search.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{_DB_FILE}"
+
+from fastapi.testclient import TestClient
+
+from database.database import Base, SessionLocal, engine
+from database.models import ApplicationTemplate, AssistantTemplate
+from main import app
+from routers.dependencies import get_current_user
+
+
+class TemplateSearchNullColumnsTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        Base.metadata.create_all(bind=engine)
+        with SessionLocal() as db:
+            db.add(AssistantTemplate(
+                name="legacy_assistant",
+                display_name="Legacy Assistant",
+                description="Seeded before the JSON defaults existed",
+                category="general",
+                system_prompt_template="You are {company}",
+                default_config=None,
+                tags=None,
+                prompt_variables=None,
+            ))
+            db.add(ApplicationTemplate(
+                name="legacy_application",
+                display_name="Legacy Application",
+                description="Seeded before the JSON defaults existed",
+                category="general",
+                tags=None,
+                template_config=None,
+                default_assistants=None,
+            ))
+            db.commit()
+        app.dependency_overrides[get_current_user] = lambda: {"user_id": 1, "username": "test", "is_admin": False}
+        # No context manager: skip the lifespan warmups, they are not under test
+        cls.client = TestClient(app)
+
+    @classmethod
+    def tearDownClass(cls):
+        app.dependency_overrides.pop(get_current_user, None)
+        engine.dispose()
+
+    def test_assistant_template_with_null_json_columns(self):
+        response = self.client.get("/admin/templates/search", params={"q": "legacy", "template_type": "assistant"})
+        self.assertEqual(response.status_code, 200)
+        template = response.json()["assistant_templates"][0]
+        self.assertEqual(template["default_config"], {})
+        self.assertEqual(template["tags"], [])
+        self.assertEqual(template["prompt_variables"], [])
+
+    def test_application_template_with_null_json_columns(self):
+        response = self.client.get("/admin/templates/search", params={"q": "legacy", "template_type": "application"})
+        self.assertEqual(response.status_code, 200)
+        template = response.json()["application_templates"][0]
+        self.assertEqual(template["template_config"], {})
+        self.assertEqual(template["tags"], [])
+        self.assertEqual(template["default_assistants"], [])
+
+
+if __name__ == "__main__":
+    unittest.main()